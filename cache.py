@@ -0,0 +1,228 @@
+"""
+cache.py — 번역 결과 캐시 모듈
+
+동일한 원문(텍스트 + 스타일 구조)의 번역 결과를 메모리 LRU + SQLite(WAL)에 저장합니다.
+슬라이드마다 반복되는 바닥글·섹션 제목·저작권 문구와, 같은 덱을 다시 번역할 때의
+API 호출을 생략하는 데 사용됩니다.
+
+프레젠테이션 요약(Phase 0)도 덱 내용 해시 + 대상 언어 기준으로 summaries.json에 저장합니다.
+슬라이드별 원문→번역 쌍은 history-{덱 해시}-{언어}.jsonl에 누적하여, --slides로 일부만
+다시 번역할 때 앞 슬라이드의 용어 이력을 이어받습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_dir() -> str:
+    """캐시 디렉터리 경로를 반환합니다 (XDG_CACHE_HOME 우선, 기본 ~/.cache/pptx-translator)."""
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pptx-translator")
+
+
+class TranslationCache:
+    """
+    키 → 번역 결과(dict) 캐시.
+
+    최근 항목은 메모리 LRU에서 바로 반환하고, path가 주어지면 SQLite에도 기록하여
+    다음 실행에서 재사용합니다. 디스크 오류 시 메모리 캐시만으로 동작합니다.
+    실행 중인 이벤트 루프 안에서 동기 래퍼를 쓰면 작업 스레드에서도 호출되므로,
+    SQLite 연결은 스레드 간에 공유하고 모든 접근을 Lock으로 직렬화합니다.
+    """
+
+    def __init__(self, path: str | None = None, max_memory_entries: int = 4096):
+        self._memory: OrderedDict[str, dict] = OrderedDict()
+        self._max_memory_entries = max_memory_entries
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"번역 캐시 파일을 열 수 없어 메모리 캐시만 사용합니다: {e}")
+                self._db = None
+
+    def _remember(self, key: str, value: dict) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> dict | None:
+        """캐시된 번역 결과를 반환합니다. 없으면 None."""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> dict | None:
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            return value
+
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT value FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"번역 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+
+        value = json.loads(row[0])
+        self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: dict) -> None:
+        """번역 결과를 캐시에 저장합니다."""
+        with self._lock:
+            self._set(key, value)
+
+    def _set(self, key: str, value: dict) -> None:
+        self._remember(key, value)
+        if self._db is None:
+            return
+        try:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False)),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"번역 캐시 저장 실패: {e}")
+
+    def clear(self, persistent: bool = False) -> None:
+        """메모리 캐시를 비웁니다. persistent=True면 SQLite에 저장된 항목도 삭제합니다."""
+        with self._lock:
+            self._memory.clear()
+            if not persistent or self._db is None:
+                return
+            try:
+                with self._db:
+                    self._db.execute("DELETE FROM translations")
+            except sqlite3.Error as e:
+                logger.warning(f"번역 캐시 삭제 실패: {e}")
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# ──────────────────────────────────────────────
+#  프레젠테이션 요약 캐시 (summaries.json)
+# ──────────────────────────────────────────────
+
+SUMMARY_CACHE_FILE = "summaries.json"
+
+
+def summary_cache_key(text: str, target_lang: str) -> str:
+    """요약 입력 텍스트(상위 슬라이드 내용)와 대상 언어로 요약 캐시 키를 생성합니다."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{digest}:{target_lang}"
+
+
+def _load_summaries(path: str) -> dict[str, str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"요약 캐시를 읽을 수 없습니다: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def get_cached_summary(key: str) -> str | None:
+    """저장된 프레젠테이션 요약을 반환합니다. 없으면 None."""
+    return _load_summaries(os.path.join(get_cache_dir(), SUMMARY_CACHE_FILE)).get(key)
+
+
+def save_summary(key: str, summary: str) -> None:
+    """프레젠테이션 요약을 summaries.json에 저장합니다 (임시 파일 → rename)."""
+    path = os.path.join(get_cache_dir(), SUMMARY_CACHE_FILE)
+    summaries = _load_summaries(path)
+    summaries[key] = summary
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"요약 캐시 저장 실패: {e}")
+
+
+# ──────────────────────────────────────────────
+#  번역 이력 (history-{deck_hash}-{lang}.jsonl)
+# ──────────────────────────────────────────────
+
+def deck_hash(path: str) -> str:
+    """입력 PPTX 파일 내용의 해시를 반환합니다 (이력 파일 구분용)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def get_history_path(deck_digest: str, target_lang: str) -> str:
+    """덱 해시와 대상 언어에 해당하는 번역 이력 파일 경로를 반환합니다."""
+    return os.path.join(get_cache_dir(), f"history-{deck_digest}-{target_lang}.jsonl")
+
+
+def load_history(path: str, before_slide: int, window: int = 3) -> list[list[dict]]:
+    """
+    before_slide보다 앞선 슬라이드 중 마지막 window장의 원문→번역 쌍을 반환합니다.
+    같은 슬라이드가 여러 번 기록되어 있으면 마지막 기록을 사용합니다.
+
+    Returns:
+        [slide_pairs, ...] (슬라이드 번호 순)
+    """
+    by_slide: dict[int, list[dict]] = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue  # 중단된 쓰기 등으로 깨진 줄은 무시
+                if item.get("slide", before_slide) < before_slide and item.get("pairs"):
+                    by_slide[item["slide"]] = item["pairs"]
+    except FileNotFoundError:
+        return []
+    except OSError as e:
+        logger.warning(f"번역 이력을 읽을 수 없습니다: {e}")
+        return []
+    return [by_slide[n] for n in sorted(by_slide)[-window:]]
+
+
+def append_history(path: str, slide_num: int, pairs: list[dict]) -> None:
+    """슬라이드 하나의 원문→번역 쌍을 이력 파일에 추가합니다."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"slide": slide_num, "pairs": pairs}, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"번역 이력 저장 실패: {e}")
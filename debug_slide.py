@@ -4,49 +4,51 @@ from pptx_handler import extract_styled_paragraphs
 from lxml import etree
 
 NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+NSMAP = {'a': NS[1:-1]}
+
+# 반복 find() 대신 모듈 로드 시 1회 컴파일한 XPath 사용
+_FIND_RPR = etree.XPath('./a:rPr', namespaces=NSMAP)
+_SOLID_RGB = etree.XPath('a:solidFill/a:srgbClr/@val', namespaces=NSMAP)
+_HAS_GRAD = etree.XPath('boolean(a:gradFill)', namespaces=NSMAP)
 
 # 원본과 번역본 모두 분석
 for fname in ['Foundry_L300.PPTX', 'Foundry_L300_ko.PPTX']:
     prs = Presentation(fname)
     for si, slide in enumerate(prs.slides):
-        full_text = ""
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                full_text += shape.text_frame.text + " "
-        
+        # 텍스트 프레임별 텍스트를 1회만 읽어 검색/출력에 재사용
+        shape_texts = [(shape, shape.text_frame.text)
+                       for shape in slide.shapes if shape.has_text_frame]
+        full_text = " ".join(t for _, t in shape_texts)
+
         if 'trust' in full_text.lower() or '신뢰' in full_text:
             if 'data' in full_text.lower() or '데이터' in full_text:
                 print(f"\n{'='*60}")
                 print(f"파일: {fname}, 슬라이드 {si+1}")
                 print(f"{'='*60}")
-                for shape in slide.shapes:
-                    if not shape.has_text_frame:
-                        continue
+                for shape, shape_text in shape_texts:
                     tf = shape.text_frame
-                    text = tf.text.strip()
+                    text = shape_text.strip()
                     if not text:
                         continue
                     print(f"\n  Shape {shape.shape_id}: '{text[:60]}...' " if len(text)>60 else f"\n  Shape {shape.shape_id}: '{text}'")
-                    
+
                     for pi, para in enumerate(tf.paragraphs):
                         runs = list(para.runs)
                         if not runs:
                             continue
                         for ri, run in enumerate(runs):
-                            rPr = run._r.find(f'{NS}rPr')
+                            found = _FIND_RPR(run._r)
+                            rPr = found[0] if found else None
                             attrs = {}
                             if rPr is not None:
                                 attrs['sz'] = rPr.get('sz')
                                 attrs['b'] = rPr.get('b')
                                 attrs['i'] = rPr.get('i')
                                 # color
-                                solid = rPr.find(f'{NS}solidFill')
-                                if solid is not None:
-                                    srgb = solid.find(f'{NS}srgbClr')
-                                    if srgb is not None:
-                                        attrs['color'] = srgb.get('val')
-                                grad = rPr.find(f'{NS}gradFill')
-                                if grad is not None:
+                                color = _SOLID_RGB(rPr)
+                                if color:
+                                    attrs['color'] = str(color[0])
+                                if _HAS_GRAD(rPr):
                                     attrs['gradFill'] = True
                             print(f"    P{pi}R{ri}: '{run.text}' | {attrs}")
                 break  # 한 슬라이드만
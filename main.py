@@ -10,30 +10,13 @@ main.py — PowerPoint 슬라이드 번역기 CLI 진입점
 """
 
 import argparse
-import copy
+import asyncio
 import logging
 import os
-import shutil
 import sys
 
-from dotenv import load_dotenv
-from pptx import Presentation
-from tqdm import tqdm
-
-from pptx_handler import (
-    extract_slide_context,
-    extract_styled_paragraphs,
-    apply_translated_runs,
-    backup_paragraph_xml,
-    iter_translatable_shapes,
-    get_target_font,
-)
-from translator import (
-    get_presentation_summary,
-    translate_styled_text,
-    translate_slide_batch,
-    get_lang_name,
-)
+# pptx/lxml, openai, tqdm 등 무거운 모듈은 사용하는 함수 안에서 import 합니다.
+# (--help, 인자 오류, 파일 없음 등 조기 종료 경로의 시작 시간 단축)
 
 # ──────────────────────────────────────────────
 #  로깅 설정
@@ -101,216 +84,513 @@ def _parse_slide_range(slides_arg: str, total_slides: int) -> set[int]:
 
 
 # ──────────────────────────────────────────────
-#  텍스트 프레임 번역
+#  입력 파일 프리페치
 # ──────────────────────────────────────────────
 
-def translate_text_frame(text_frame, context: str, target_lang: str,
-                         target_font: str | None = None,
-                         pres_summary: str = "") -> bool:
+def prefetch_file(path: str) -> None:
     """
-    텍스트 프레임 내 텍스트를 번역합니다.
+    입력 PPTX를 커널 페이지 캐시로 미리 읽어들이도록 요청합니다 (콜드 캐시 대응).
 
-    Returns:
-        True: 번역 성공, False: 스킵 또는 실패
+    Presentation()은 zip 파트를 하나씩 순차로 읽으므로, 이미지가 많은 덱은
+    작은 read()가 반복됩니다. posix_fadvise(WILLNEED)로 파일 전체의
+    비동기 readahead를 한 번에 걸어 두면 이후 읽기가 캐시에서 처리됩니다.
+    지원하지 않는 플랫폼(Windows/macOS)에서는 아무 작업도 하지 않습니다.
     """
-    styled_data = extract_styled_paragraphs(text_frame)
-    if styled_data is None:
-        return False  # 텍스트 없음
-
-    # 원본 텍스트 추출 (로그용)
-    original_text = " | ".join(
-        "".join(r["text"] for r in p["runs"])
-        for p in styled_data["paragraphs"]
-    ).strip()
-
-    # GPT 번역 요청
-    translated = translate_styled_text(styled_data, context, target_lang,
-                                       pres_summary=pres_summary)
-    if translated is None:
-        logger.warning("  번역 실패 — 원문 유지")
-        return False
+    if not hasattr(os, "posix_fadvise"):
+        logger.debug("posix_fadvise 미지원 플랫폼 — 프리페치 생략")
+        return
 
-    # 번역 결과 적용 (run.text 교체 방식 — XML 조작 없음)
     try:
-        apply_translated_runs(text_frame, translated, styled_data["styles"],
-                              target_font=target_font, target_lang=target_lang,
-                              rPr_xml_map=styled_data.get("rPr_xml_map"))
-        # 교체 로그
-        translated_text = " | ".join(
-            "".join(r["text"] for r in p["runs"])
-            for p in translated["paragraphs"]
-        ).strip()
-        logger.info(f"  [교체 완료] \"{original_text}\" → \"{translated_text}\"")
-        return True
-    except Exception as e:
-        logger.error(f"  번역 적용 중 오류: {e}")
-        return False
+        fd = os.open(path, os.O_RDONLY)
+    except OSError as e:
+        logger.warning(f"프리페치 실패 (파일 열기): {e}")
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError as e:
+        logger.warning(f"프리페치 실패: {e}")
+    finally:
+        os.close(fd)
 
 
 # ──────────────────────────────────────────────
-#  테이블 번역
+#  슬라이드 번역
 # ──────────────────────────────────────────────
 
-def translate_table(table, context: str, target_lang: str,
-                    target_font: str | None = None,
-                    pres_summary: str = "") -> int:
-    """
-    테이블의 각 셀을 번역합니다.
-
-    Returns:
-        번역된 셀 수
-    """
-    translated_count = 0
-    for row in table.rows:
-        for cell in row.cells:
-            if cell.text.strip():
-                success = translate_text_frame(cell.text_frame, context, target_lang,
-                                              target_font, pres_summary=pres_summary)
-                if success:
-                    translated_count += 1
-    return translated_count
+# 번역 항목 출처 → 통계 키
+_STAT_KEYS = {"text_frame": "text_frames", "note": "notes", "table_cell": "cells"}
 
 
-# ──────────────────────────────────────────────
-#  슬라이드 번역
-# ──────────────────────────────────────────────
-
-def translate_slide(slide, slide_num: int, target_lang: str,
-                    pres_summary: str = "",
-                    recent_translations: list[dict] | None = None) -> tuple[dict, list[dict]]:
+def collect_slide_items(slide, slide_num: int) -> tuple[list[tuple], dict]:
     """
-    슬라이드 하나를 번역합니다.
-    텍스트 프레임 + 테이블 셀을 모두 수집 → 1회 API 호출로 일괄 번역 → 결과 적용.
-    Phase 0 프레젠테이션 요약 + 직전 슬라이드 번역 이력을 맥락으로 활용합니다.
+    슬라이드의 텍스트 프레임 + 테이블 셀 + 노트를 번역 항목으로 수집합니다.
 
     Returns:
-        (stats, slide_pairs)
-        stats: {"text_frames": N, "tables": N, "cells": N} 번역 통계
-        slide_pairs: 이 슬라이드의 원문→번역 쌍 [{"src": ..., "tgt": ...}, ...]
+        (batch_items, table_cell_ids)
+        batch_items: [(text_frame, styled_data, box_id, source), ...]
+        table_cell_ids: box_id → table index (통계용)
     """
-    stats = {"text_frames": 0, "tables": 0, "cells": 0, "notes": 0}
-    slide_pairs: list[dict] = []
-    target_font = get_target_font(target_lang)
-
-    # 슬라이드에 텍스트가 있는지 빠르게 확인
-    slide_text = extract_slide_context(slide)
-    if not slide_text.strip():
-        logger.info(f"  슬라이드 {slide_num}: 텍스트 없음 — 스킵")
-        return stats, slide_pairs
-
-    # 텍스트 프레임 + 테이블 셀 + 노트를 하나의 배치로 수집
-    batch_items = []   # (text_frame, styled_data, box_id, source)
-    box_counter = 0
-    table_cell_ids = {}  # box_id → table index (통계용)
+    from pptx_handler import extract_styled_paragraphs, has_text, iter_translatable_shapes
 
+    # 1) 번역 대상 텍스트 프레임 목록 수집: (text_frame, box_id 접두어, source, table index)
+    candidates = []
+    table_count = 0
     for shape, shape_type in iter_translatable_shapes(slide):
         if shape_type == "text_frame":
-            styled_data = extract_styled_paragraphs(shape.text_frame)
-            if styled_data is not None:
-                box_id = f"T{box_counter}"
-                box_counter += 1
-                batch_items.append((shape.text_frame, styled_data, box_id, "text_frame"))
+            text_frame = shape.text_frame
+            if has_text(text_frame):
+                candidates.append((text_frame, "T", "text_frame", None))
         elif shape_type == "table":
-            table_idx = stats["tables"] + len(table_cell_ids) + 1
+            table_count += 1
             for row in shape.table.rows:
                 for cell in row.cells:
-                    if cell.text.strip():
-                        styled_data = extract_styled_paragraphs(cell.text_frame)
-                        if styled_data is not None:
-                            box_id = f"C{box_counter}"
-                            box_counter += 1
-                            batch_items.append((cell.text_frame, styled_data, box_id, "table_cell"))
-                            table_cell_ids[box_id] = table_idx
+                    cell_tf = cell.text_frame
+                    if has_text(cell_tf):
+                        candidates.append((cell_tf, "C", "table_cell", table_count))
 
     # 슬라이드 노트
     try:
         if slide.has_notes_slide:
             notes_tf = slide.notes_slide.notes_text_frame
-            if notes_tf.text.strip():
-                styled_data = extract_styled_paragraphs(notes_tf)
-                if styled_data is not None:
-                    box_id = f"N{box_counter}"
-                    box_counter += 1
-                    batch_items.append((notes_tf, styled_data, box_id, "note"))
+            if has_text(notes_tf):
+                candidates.append((notes_tf, "N", "note", None))
     except Exception:
         pass  # 노트 없거나 접근 불가 시 무시
 
-    if not batch_items:
-        logger.info(f"  슬라이드 {slide_num}: 번역할 항목 없음 — 스킵")
-        return stats
+    # 2) 스타일 추출 — 같은 슬라이드 XML에 rPr을 추가하므로 순차 처리 (lxml 트리는 동시 수정 불가)
+    styled_list = [extract_styled_paragraphs(c[0]) for c in candidates]
 
-    # 일괄 번역 (1회 API 호출)
-    batch_input = [
-        {"box_id": box_id, "styled_data": sd}
-        for (_, sd, box_id, _) in batch_items
-    ]
-    logger.info(f"  슬라이드 {slide_num}: {len(batch_input)}개 항목 일괄 번역 요청...")
-    translated_map = translate_slide_batch(
-        batch_input, "", target_lang, pres_summary=pres_summary,
-        recent_translations=recent_translations,
-    )
+    # 3) 텍스트가 있는 항목에만 순서대로 box_id 부여
+    batch_items = []   # (text_frame, styled_data, box_id, source)
+    table_cell_ids = {}  # box_id → table index (통계용)
+    box_counter = 0
+    for (text_frame, prefix, source, table_idx), styled_data in zip(candidates, styled_list):
+        if styled_data is None:
+            continue
+        box_id = f"{prefix}{box_counter}"
+        box_counter += 1
+        batch_items.append((text_frame, styled_data, box_id, source))
+        if table_idx is not None:
+            table_cell_ids[box_id] = table_idx
 
-    if translated_map is None:
-        logger.warning(f"  슬라이드 {slide_num}: 일괄 번역 실패 — 개별 번역으로 폴백")
-        for text_frame, styled_data, box_id, source in batch_items:
-            translated = translate_styled_text(
-                styled_data, "", target_lang, pres_summary=pres_summary
-            )
-            if translated is not None:
-                try:
-                    apply_translated_runs(
-                        text_frame, translated, styled_data["styles"],
-                        target_font=target_font, target_lang=target_lang,
-                        rPr_xml_map=styled_data.get("rPr_xml_map")
-                    )
-                    if source == "text_frame":
-                        stats["text_frames"] += 1
-                    elif source == "note":
-                        stats["notes"] += 1
-                    else:
-                        stats["cells"] += 1
-                except Exception as e:
-                    logger.error(f"  [{box_id}] 번역 적용 중 오류: {e}")
+    return batch_items, table_cell_ids
+
+
+def prepare_slide_group(group: list[tuple], target_lang: str) -> dict:
+    """
+    슬라이드 그룹의 번역 항목을 펼치고 캐시를 조회합니다.
+    여러 슬라이드를 묶을 때는 box_id 앞에 슬라이드 번호를 붙여(예: S3_T0) 결과를 다시 나눕니다.
+
+    Args:
+        group: [(slide_num, batch_items, table_cell_ids), ...] — collect_slide_items() 결과
+
+    Returns:
+        {
+            "label": "슬라이드 3-5",
+            "entries": [(slide_num, text_frame, styled_data, box_id, source), ...],
+            "cache_keys": {box_id: cache_key},
+            "cached_map": {box_id: 캐시된 번역 결과},
+            "batch_input": [{"box_id": ..., "styled_data": ...}, ...],  # 캐시 미스 → API 요청 대상
+            "aliases": {대표 box_id: [같은 원문의 box_id, ...]}  # batch_input에서 제외된 중복
+        }
+    """
+    from translator import get_cached_translation, translation_cache_key
+
+    merged = len(group) > 1
+    if merged:
+        label = f"슬라이드 {group[0][0]}-{group[-1][0]}"
     else:
+        label = f"슬라이드 {group[0][0]}"
+
+    # (slide_num, text_frame, styled_data, box_id, source)
+    entries = []
+    for slide_num, batch_items, _ in group:
+        prefix = f"S{slide_num}_" if merged else ""
         for text_frame, styled_data, box_id, source in batch_items:
-            if box_id not in translated_map:
-                logger.warning(f"  [{box_id}] 번역 결과 누락 — 원문 유지")
-                continue
-            try:
-                apply_translated_runs(
-                    text_frame, translated_map[box_id], styled_data["styles"],
-                    target_font=target_font, target_lang=target_lang,
-                    rPr_xml_map=styled_data.get("rPr_xml_map")
-                )
-                if source == "text_frame":
-                    stats["text_frames"] += 1
-                elif source == "note":
-                    stats["notes"] += 1
-                else:
-                    stats["cells"] += 1
-            except Exception as e:
-                logger.error(f"  [{box_id}] 번역 적용 중 오류: {e}")
+            entries.append((slide_num, text_frame, styled_data, prefix + box_id, source))
+
+    # 캐시 조회: 이미 번역한 동일 원문(바닥글, 반복 제목 등)은 재사용하고 나머지만 요청
+    # 그룹 내 동일 원문(같은 셀 값, 반복 글머리표)은 대표 box_id 하나만 요청하고 결과를 공유
+    cache_keys: dict[str, str] = {}
+    cached_map: dict[str, dict] = {}
+    batch_input = []
+    canonical_by_key: dict[str, str] = {}   # cache_key → 대표 box_id
+    aliases: dict[str, list[str]] = {}      # 대표 box_id → 같은 원문의 다른 box_id
+    for _, _, sd, box_id, _ in entries:
+        key = translation_cache_key(sd, target_lang)
+        cache_keys[box_id] = key
+        cached = get_cached_translation(key)
+        if cached is not None:
+            cached_map[box_id] = cached
+        elif key in canonical_by_key:
+            aliases[canonical_by_key[key]].append(box_id)
+        else:
+            canonical_by_key[key] = box_id
+            aliases[box_id] = []
+            batch_input.append({"box_id": box_id, "styled_data": sd})
+
+    return {
+        "label": label,
+        "entries": entries,
+        "cache_keys": cache_keys,
+        "cached_map": cached_map,
+        "batch_input": batch_input,
+        "aliases": aliases,
+    }
+
+
+def finish_slide_group(group: list[tuple], prepared: dict, translated_map: dict,
+                       target_lang: str) -> list[tuple[int, dict, list[dict]]]:
+    """
+    번역 결과를 캐시에 저장하고 슬라이드에 적용한 뒤, 슬라이드별 통계와 원문→번역 쌍을 반환합니다.
+
+    Args:
+        prepared: prepare_slide_group() 결과
+        translated_map: box_id → 번역 결과 (캐시 적중분 포함)
+
+    Returns:
+        [(slide_num, stats, slide_pairs), ...] (group 순서)
+        stats: {"text_frames": N, "tables": N, "cells": N, "notes": N} 번역 통계
+        slide_pairs: 해당 슬라이드의 원문→번역 쌍 [{"src": ..., "tgt": ...}, ...]
+    """
+    from pptx_handler import apply_translated_runs, get_target_font
+    from translator import cache_translation
+
+    target_font = get_target_font(target_lang)
+    entries = prepared["entries"]
+    stats_by_slide = {
+        slide_num: {"text_frames": 0, "tables": 0, "cells": 0, "notes": 0}
+        for slide_num, _, _ in group
+    }
+    pairs_by_slide: dict[int, list[dict]] = {slide_num: [] for slide_num, _, _ in group}
+
+    for item in prepared["batch_input"]:
+        box_id = item["box_id"]
+        if box_id in translated_map:
+            cache_translation(prepared["cache_keys"][box_id], translated_map[box_id])
+            # 중복 원문에 대표 번역 결과를 공유
+            for alias_id in prepared["aliases"][box_id]:
+                translated_map[alias_id] = translated_map[box_id]
+
+    for slide_num, text_frame, styled_data, box_id, source in entries:
+        if box_id not in translated_map:
+            logger.warning(f"  [{box_id}] 번역 결과 누락 — 원문 유지")
+            continue
+        try:
+            apply_translated_runs(
+                text_frame, translated_map[box_id],
+                target_font=target_font, target_lang=target_lang,
+                rPr_xml_map=styled_data.get("rPr_xml_map"),
+                run_elems=styled_data.get("run_elems"),
+            )
+            stats_by_slide[slide_num][_STAT_KEYS[source]] += 1
+        except Exception as e:
+            logger.error(f"  [{box_id}] 번역 적용 중 오류: {e}")
 
     # 테이블 수 집계
-    if table_cell_ids:
-        stats["tables"] = len(set(table_cell_ids.values()))
+    for slide_num, _, table_cell_ids in group:
+        if table_cell_ids:
+            stats_by_slide[slide_num]["tables"] = len(set(table_cell_ids.values()))
 
     # 원문→번역 쌍 수집 (용어 일관성 참조용)
-    if translated_map:
-        for _, styled_data, box_id, _ in batch_items:
-            if box_id not in translated_map:
+    for slide_num, _, styled_data, box_id, _ in entries:
+        if box_id not in translated_map:
+            continue
+        src_text = styled_data["flat_text"].strip()
+        tgt_text = " ".join(
+            r.get("text", "") for p in translated_map[box_id].get("paragraphs", [])
+            for r in p.get("runs", [])
+        ).strip()
+        if src_text and tgt_text and src_text != tgt_text:
+            pairs_by_slide[slide_num].append({"src": src_text, "tgt": tgt_text})
+
+    return [
+        (slide_num, stats_by_slide[slide_num], pairs_by_slide[slide_num])
+        for slide_num, _, _ in group
+    ]
+
+
+async def translate_slide_group(group: list[tuple], target_lang: str,
+                                pres_summary: str = "",
+                                recent_translations=None,
+                                ) -> list[tuple[int, dict, list[dict]]]:
+    """
+    하나 이상의 슬라이드 번역 항목을 1회 API 호출로 일괄 번역하고 결과를 적용합니다.
+
+    Args:
+        group: [(slide_num, batch_items, table_cell_ids), ...] — collect_slide_items() 결과
+        recent_translations: translator.RecentTranslations (직전 슬라이드 번역 이력) 또는 None
+
+    Returns:
+        [(slide_num, stats, slide_pairs), ...] — finish_slide_group() 참고
+    """
+    from translator import atranslate_slide_batch, atranslate_styled_text
+
+    prepared = prepare_slide_group(group, target_lang)
+    label = prepared["label"]
+    cached_map = prepared["cached_map"]
+    batch_input = prepared["batch_input"]
+
+    # 일괄 번역 (1회 API 호출)
+    if batch_input:
+        logger.info(
+            f"  {label}: {len(batch_input)}개 항목 일괄 번역 요청... "
+            f"(캐시 적중 {len(cached_map)}개)"
+        )
+        translated_map = await atranslate_slide_batch(
+            batch_input, "", target_lang, pres_summary=pres_summary,
+            recent_translations=recent_translations,
+        )
+        if translated_map is not None:
+            translated_map.update(cached_map)
+    else:
+        logger.info(f"  {label}: {len(cached_map)}개 항목 모두 캐시 적중 — API 호출 생략")
+        translated_map = dict(cached_map)
+
+    if translated_map is None:
+        logger.warning(f"  {label}: 일괄 번역 실패 — 개별 번역으로 폴백")
+        translated_map = dict(cached_map)
+        for item in batch_input:
+            translated = await atranslate_styled_text(
+                item["styled_data"], "", target_lang, pres_summary=pres_summary
+            )
+            if translated is not None:
+                translated_map[item["box_id"]] = translated
+
+    return finish_slide_group(group, prepared, translated_map, target_lang)
+
+
+# ──────────────────────────────────────────────
+#  작은 슬라이드 묶기
+# ──────────────────────────────────────────────
+
+def _styled_text_len(styled_data: dict) -> int:
+    """번역 항목의 원문 글자 수를 반환합니다."""
+    return sum(len(r["text"]) for p in styled_data["paragraphs"] for r in p["runs"])
+
+
+class SlideBatcher:
+    """
+    연속된 작은 슬라이드의 번역 항목을 하나의 API 호출로 묶습니다.
+
+    누적 원문 글자 수가 max_chars 이상이거나 항목 수가 max_items 이상이 되면 그룹을 닫습니다.
+    제목 한 줄짜리 슬라이드마다 API를 호출하는 대신 여러 장을 한 번에 보내므로
+    RPM 한도 안에서 처리량이 늘어납니다. max_items=1이면 슬라이드마다 따로 호출합니다.
+    """
+
+    def __init__(self, max_chars: int = 4000, max_items: int = 20):
+        self.max_chars = max_chars
+        self.max_items = max_items
+        self._pending: list[tuple] = []
+        self._chars = 0
+        self._items = 0
+
+    def _close(self) -> list[tuple]:
+        group = self._pending
+        self._pending = []
+        self._chars = 0
+        self._items = 0
+        return group
+
+    def add(self, slide_job: tuple) -> list[list[tuple]]:
+        """
+        슬라이드 하나를 추가하고, 이번 추가로 닫힌 그룹 목록을 반환합니다.
+
+        Args:
+            slide_job: (slide_num, batch_items, table_cell_ids)
+        """
+        _, batch_items, _ = slide_job
+        chars = sum(_styled_text_len(sd) for _, sd, _, _ in batch_items)
+        closed = []
+
+        # 이번 슬라이드를 더하면 한도를 넘는 경우 기존 묶음을 먼저 닫음
+        if self._pending and (self._chars + chars > self.max_chars
+                              or self._items + len(batch_items) > self.max_items):
+            closed.append(self._close())
+
+        self._pending.append(slide_job)
+        self._chars += chars
+        self._items += len(batch_items)
+        if self._chars >= self.max_chars or self._items >= self.max_items:
+            closed.append(self._close())
+        return closed
+
+    def flush(self) -> list[list[tuple]]:
+        """남은 슬라이드를 마지막 그룹으로 반환합니다."""
+        return [self._close()] if self._pending else []
+
+
+# ──────────────────────────────────────────────
+#  슬라이드 동시 번역
+# ──────────────────────────────────────────────
+
+async def translate_slides(groups: list[list[tuple]], target_lang: str,
+                           pres_summary: str, concurrency: int, pbar,
+                           initial_history: list[list[dict]] | None = None,
+                           history_path: str | None = None) -> dict:
+    """
+    슬라이드 그룹들을 최대 concurrency개씩 동시에 번역합니다.
+    API 대기 시간이 겹치므로 전체 소요 시간이 슬라이드 수에 비례하지 않습니다.
+    XML 추출/적용은 이벤트 루프 스레드에서 await 사이에 실행되므로 별도 잠금이 필요 없습니다.
+
+    Args:
+        groups: SlideBatcher가 만든 그룹 목록 [[(slide_num, batch_items, table_cell_ids), ...], ...]
+        concurrency: 동시에 번역할 최대 그룹 수
+        pbar: 진행 표시줄 (완료 순서대로 갱신)
+        initial_history: 이전 실행에서 불러온 앞 슬라이드 번역 쌍 (슬라이딩 윈도우 초기값)
+        history_path: 슬라이드별 번역 쌍을 누적 기록할 JSONL 경로 (None이면 기록 안 함)
+
+    Returns:
+        {"text_frames": N, "tables": N, "cells": N, "notes": N} 전체 통계
+    """
+    from cache import append_history
+    from translator import RecentTranslations
+
+    total_stats = {"text_frames": 0, "tables": 0, "cells": 0, "notes": 0}
+    # 직전 3장 번역 이력 (용어 일관성 유지용 슬라이딩 윈도우, 완료 순서 기준)
+    recent = RecentTranslations(max_slides=3, initial=initial_history)
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def worker(group: list[tuple]) -> list[tuple[int, dict, list[dict]]]:
+        async with sem:
+            # 이 그룹 시작 전에 완료된 최근 3장의 번역 쌍 (렌더링 결과는 추가 시에만 갱신)
+            return await translate_slide_group(
+                group, target_lang,
+                pres_summary=pres_summary,
+                recent_translations=recent,
+            )
+
+    tasks = [worker(group) for group in groups]
+    for next_done in asyncio.as_completed(tasks):
+        results = await next_done
+
+        for slide_num, stats, slide_pairs in results:
+            # 슬라이딩 윈도우 갱신 (최근 3장 유지)
+            if slide_pairs:
+                recent.add_slide(slide_pairs)
+                if history_path:
+                    append_history(history_path, slide_num, slide_pairs)
+
+            total_stats["text_frames"] += stats["text_frames"]
+            total_stats["tables"] += stats["tables"]
+            total_stats["cells"] += stats["cells"]
+            total_stats["notes"] += stats["notes"]
+
+        pbar.update(len(results))
+        pbar.set_postfix(
+            텍스트=total_stats["text_frames"],
+            표=total_stats["tables"],
+            노트=total_stats["notes"],
+        )
+
+    return total_stats
+
+
+# ──────────────────────────────────────────────
+#  Batch API 모드 (--async-batch)
+# ──────────────────────────────────────────────
+
+def translate_slides_batch_api(groups: list[list[tuple]], target_lang: str,
+                               pres_summary: str, concurrency: int, pbar,
+                               poll_interval: float = 30.0,
+                               initial_history: list[list[dict]] | None = None,
+                               history_path: str | None = None) -> dict:
+    """
+    모든 슬라이드 그룹을 하나의 Batch API 작업으로 제출하고, 완료되면 결과를 적용합니다.
+    동기 호출의 RPM 한도를 거치지 않고 비용도 약 50% 낮지만 완료까지 최대 24시간이 걸립니다.
+    배치 결과가 없는 그룹은 일반(동기) 경로로 다시 번역합니다.
+    이때 직전 슬라이드 번역 이력은 이력 파일(배치로 완료된 슬라이드 포함)에서, 없으면 initial_history에서 가져옵니다.
+
+    Returns:
+        {"text_frames": N, "tables": N, "cells": N, "notes": N} 전체 통계
+    """
+    from cache import append_history, load_history
+    from translator import translate_deck_batch
+
+    total_stats = {"text_frames": 0, "tables": 0, "cells": 0, "notes": 0}
+    prepared_groups = [prepare_slide_group(group, target_lang) for group in groups]
+
+    # 1) 캐시 미스 항목만 Batch 요청 대상으로
+    text_boxes_by_id: dict[str, list[dict]] = {
+        f"group-{group_idx}": prepared["batch_input"]
+        for group_idx, prepared in enumerate(prepared_groups)
+        if prepared["batch_input"]
+    }
+
+    # 2) 제출 → 완료 대기(확인 간격 지수 증가) → 결과 다운로드
+    batch_results = translate_deck_batch(
+        text_boxes_by_id, target_lang, pres_summary=pres_summary, poll_interval=poll_interval,
+    )
+
+    # 3) 결과 적용 (결과 없는 그룹은 재시도 목록으로)
+    retry_groups = []
+    for group_idx, (group, prepared) in enumerate(zip(groups, prepared_groups)):
+        if prepared["batch_input"]:
+            translated_map = batch_results.get(f"group-{group_idx}")
+            if translated_map is None:
+                retry_groups.append(group)
                 continue
-            src_text = " ".join(
-                r["text"] for p in styled_data["paragraphs"] for r in p["runs"]
-            ).strip()
-            tgt_text = " ".join(
-                r.get("text", "") for p in translated_map[box_id].get("paragraphs", [])
-                for r in p.get("runs", [])
-            ).strip()
-            if src_text and tgt_text and src_text != tgt_text:
-                slide_pairs.append({"src": src_text, "tgt": tgt_text})
+            translated_map.update(prepared["cached_map"])
+        else:
+            translated_map = dict(prepared["cached_map"])
+
+        for slide_num, stats, slide_pairs in finish_slide_group(
+            group, prepared, translated_map, target_lang
+        ):
+            for key in total_stats:
+                total_stats[key] += stats[key]
+            if history_path and slide_pairs:
+                append_history(history_path, slide_num, slide_pairs)
+        pbar.update(len(group))
+
+    if retry_groups:
+        logger.warning(f"Batch 결과 없는 그룹 {len(retry_groups)}개 — 일반 번역으로 재시도")
+        retry_history = initial_history
+        if history_path:
+            # 배치로 완료되어 방금 기록된 앞 슬라이드까지 포함한 이력
+            retry_history = load_history(history_path, before_slide=retry_groups[0][0][0])
+        retry_stats = asyncio.run(translate_slides(
+            retry_groups, target_lang, pres_summary,
+            concurrency=concurrency, pbar=pbar,
+            initial_history=retry_history, history_path=history_path,
+        ))
+        for key in total_stats:
+            total_stats[key] += retry_stats[key]
+
+    return total_stats
+
+
+# ──────────────────────────────────────────────
+#  진행 표시 (비대화형 출력용)
+# ──────────────────────────────────────────────
+
+class _NullBar:
+    """
+    stderr가 터미널이 아닐 때(CI, 파이프, 리다이렉트) tqdm 대신 쓰는 경량 진행 표시.
+    갱신마다 화면을 다시 그리지 않고, 전체의 약 5%마다 한 줄씩만 출력합니다.
+    """
+
+    def __init__(self, total: int, desc: str = ""):
+        self.total = total
+        self.desc = desc
+        self.n = 0
+        self._step = max(1, total // 20)
+        self._next_report = self._step
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def update(self, n: int = 1) -> None:
+        self.n += n
+        if self.n >= self._next_report or self.n >= self.total:
+            print(f"{self.desc}: {self.n}/{self.total}", file=sys.stderr, flush=True)
+            self._next_report = (self.n // self._step + 1) * self._step
 
-    return stats, slide_pairs
+    def set_postfix(self, **kwargs) -> None:
+        pass
 
 
 # ──────────────────────────────────────────────
@@ -342,6 +622,60 @@ def main():
         help="번역할 슬라이드 범위 (예: 5, 3-10, 1-5). 미지정 시 전체 번역",
         default=None,
     )
+    parser.add_argument(
+        "--concurrency", "-c",
+        help="동시에 번역할 최대 슬라이드 수 (기본: 4)",
+        type=int,
+        default=4,
+    )
+    parser.add_argument(
+        "--batch-chars",
+        help="여러 슬라이드를 1회 호출로 묶을 때 최대 원문 글자 수 (기본: 4000)",
+        type=int,
+        default=4000,
+    )
+    parser.add_argument(
+        "--batch-items",
+        help="여러 슬라이드를 1회 호출로 묶을 때 최대 항목 수 (기본: 20, 1이면 슬라이드별 호출)",
+        type=int,
+        default=20,
+    )
+    parser.add_argument(
+        "--async-batch",
+        help="Batch API로 덱 전체를 한 번에 제출 (비용 약 50%% 절감, 완료까지 최대 24시간)",
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--rpm",
+        help="분당 최대 API 요청 수 (배포의 RPM 한도). 미지정 시 제한 없음",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--tpm",
+        help="분당 최대 입력 토큰 수 (배포의 TPM 한도, 추정치 기준). 미지정 시 제한 없음",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--no-cache",
+        help="디스크 캐시(~/.cache/pptx-translator의 번역 결과·프레젠테이션 요약·번역 이력) 사용 안 함",
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--prefetch",
+        help="로드 전에 입력 파일을 페이지 캐시로 미리 읽기 (미디어가 많은 대용량 덱, 콜드 캐시에서 유효)",
+        action="store_true",
+        default=False,
+    )
+    parser.add_argument(
+        "--slide-context",
+        help="일괄 번역 응답에서 슬라이드 요약을 먼저 생성한 뒤 번역 (추가 API 호출 없음, 출력 토큰 소폭 증가)",
+        action="store_true",
+        default=False,
+    )
     parser.add_argument(
         "--verbose", "-v",
         help="상세 로그 출력 (기본: 생략)",
@@ -356,9 +690,6 @@ def main():
         logging.getLogger("translator").setLevel(logging.INFO)
         logging.getLogger("pptx_handler").setLevel(logging.INFO)
 
-    # ── 환경변수 로드 ──
-    load_dotenv()
-
     # ── 입력 파일 검증 ──
     if not os.path.isfile(args.input_file):
         logger.error(f"파일을 찾을 수 없습니다: {args.input_file}")
@@ -368,16 +699,45 @@ def main():
         logger.error("PPTX 파일만 지원합니다.")
         sys.exit(1)
 
+    # ── 무거운 모듈 로드 (검증 통과 후) ──
+    from dotenv import load_dotenv
+    from pptx import Presentation
+    from tqdm import tqdm
+
+    from cache import (
+        deck_hash,
+        get_cached_summary,
+        get_history_path,
+        load_history,
+        save_summary,
+        summary_cache_key,
+    )
+    from pptx_handler import extract_slide_context
+    from translator import (
+        configure_rate_limit,
+        configure_slide_context,
+        configure_translation_cache,
+        get_presentation_summary,
+        get_lang_name,
+    )
+
+    # ── 환경변수 로드 ──
+    load_dotenv()
+
+    # ── API 호출 속도 제한 / 번역 캐시 ──
+    configure_rate_limit(rpm=args.rpm, tpm=args.tpm)
+    configure_translation_cache(persist=not args.no_cache)
+    configure_slide_context(args.slide_context)
+
     # ── 출력 파일 경로 결정 ──
     output_path = args.output or make_output_path(args.input_file, args.target_lang)
 
-    # ── 파일 복제 ──
-    logger.info(f"파일 복제: {args.input_file} → {output_path}")
-    shutil.copy2(args.input_file, output_path)
-
     # ── PPTX 열기 ──
-    logger.info(f"PPTX 파일 로드 중: {output_path}")
-    prs = Presentation(output_path)
+    # 원본을 직접 열고 결과는 output_path에 새로 저장 (python-pptx가 zip을 다시 쓰므로 사전 복제 불필요)
+    if args.prefetch:
+        prefetch_file(args.input_file)
+    logger.info(f"PPTX 파일 로드 중: {args.input_file}")
+    prs = Presentation(args.input_file)
 
     total_slides = len(prs.slides)
     lang_name = get_lang_name(args.target_lang)
@@ -403,53 +763,71 @@ def main():
     logger.info(f"프레젠테이션 전체 맥락 파악 중 (상위 {top_n}장 분석)...")
     top_texts = []
     for slide in list(prs.slides)[:top_n]:
-        slide_text = extract_slide_context(slide)
-        if slide_text.strip():
-            top_texts.append(slide_text)
+        slide_context = extract_slide_context(slide)
+        if slide_context:  # 첫 텍스트를 찾는 즉시 판별 (빈 슬라이드는 전체 추출 생략)
+            top_texts.append(str(slide_context))
     if top_texts:
         combined = "\n---\n".join(top_texts)
-        pres_summary = get_presentation_summary(combined, args.target_lang)
+        # 같은 덱·같은 언어로 재실행하면 저장된 요약을 재사용 (API 호출 생략)
+        summary_key = summary_cache_key(combined, args.target_lang)
+        cached_summary = None if args.no_cache else get_cached_summary(summary_key)
+        if cached_summary is not None:
+            pres_summary = cached_summary
+            logger.info("프레젠테이션 요약: 캐시 적중 — API 호출 생략")
+        else:
+            pres_summary = get_presentation_summary(combined, args.target_lang)
+            if pres_summary and not args.no_cache:
+                save_summary(summary_key, pres_summary)
         logger.info(f"프레젠테이션 요약: {pres_summary[:120]}...")
     else:
         logger.info("텍스트 없음 — 맥락 요약 생략")
 
-    # ── 슬라이드별 번역 ──
-    total_stats = {"text_frames": 0, "tables": 0, "cells": 0, "notes": 0}
-    # 직전 3장 번역 이력 (용어 일관성 유지용 슬라이딩 윈도우)
-    recent_history: list[list[dict]] = []  # [slide_pairs, slide_pairs, ...]
-
-    with tqdm(total=target_count, desc="번역 진행", unit="slide") as pbar:
-        for slide_idx, slide in enumerate(prs.slides, 1):
-            # 범위 지정 시 해당 슬라이드만 번역
-            if slide_range and slide_idx not in slide_range:
-                continue
-
-            # 직전 3장의 번역 쌍을 평탄화하여 전달
-            flat_recent = [pair for pairs in recent_history for pair in pairs]
-
-            stats, slide_pairs = translate_slide(
-                slide, slide_idx, args.target_lang,
-                pres_summary=pres_summary,
-                recent_translations=flat_recent if flat_recent else None,
-            )
-
-            # 슬라이딩 윈도우 갱신 (최근 3장 유지)
-            if slide_pairs:
-                recent_history.append(slide_pairs)
-                if len(recent_history) > 3:
-                    recent_history.pop(0)
-
-            total_stats["text_frames"] += stats["text_frames"]
-            total_stats["tables"] += stats["tables"]
-            total_stats["cells"] += stats["cells"]
-            total_stats["notes"] += stats["notes"]
-
-            pbar.update(1)
-            pbar.set_postfix(
-                텍스트=total_stats["text_frames"],
-                표=total_stats["tables"],
-                노트=total_stats["notes"],
+    # ── 번역 항목 수집 + 작은 슬라이드 묶기 ──
+    batcher = SlideBatcher(max_chars=args.batch_chars, max_items=args.batch_items)
+    groups: list[list[tuple]] = []
+    skipped = 0
+    for slide_idx, slide in enumerate(prs.slides, 1):
+        # 범위 지정 시 해당 슬라이드만 번역
+        if slide_range and slide_idx not in slide_range:
+            continue
+        batch_items, table_cell_ids = collect_slide_items(slide, slide_idx)
+        if not batch_items:
+            logger.info(f"  슬라이드 {slide_idx}: 번역할 항목 없음 — 스킵")
+            skipped += 1
+            continue
+        groups.extend(batcher.add((slide_idx, batch_items, table_cell_ids)))
+    groups.extend(batcher.flush())
+    logger.info(f"API 호출 그룹: {len(groups)}개 (슬라이드 {target_count - skipped}장)")
+
+    # ── 이전 실행의 번역 이력 불러오기 (--slides로 중간부터 재실행 시 용어 일관성 유지) ──
+    history_path = None
+    initial_history: list[list[dict]] = []
+    if not args.no_cache:
+        history_path = get_history_path(deck_hash(args.input_file), args.target_lang)
+        first_slide = min(slide_range) if slide_range else 1
+        initial_history = load_history(history_path, before_slide=first_slide)
+        if initial_history:
+            logger.info(f"이전 번역 이력 {len(initial_history)}장 불러옴 (슬라이드 {first_slide} 이전)")
+
+    # ── 그룹별 번역 (동시 실행) ──
+    if sys.stderr.isatty():
+        progress = tqdm(total=target_count, desc="번역 진행", unit="slide")
+    else:
+        progress = _NullBar(target_count, desc="번역 진행")
+    with progress as pbar:
+        pbar.update(skipped)
+        if args.async_batch:
+            total_stats = translate_slides_batch_api(
+                groups, args.target_lang, pres_summary,
+                concurrency=args.concurrency, pbar=pbar,
+                initial_history=initial_history, history_path=history_path,
             )
+        else:
+            total_stats = asyncio.run(translate_slides(
+                groups, args.target_lang, pres_summary,
+                concurrency=args.concurrency, pbar=pbar,
+                initial_history=initial_history, history_path=history_path,
+            ))
 
     # ── 저장 ──
     logger.info("=" * 60)
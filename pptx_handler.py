@@ -9,73 +9,108 @@ pptx_handler.py — PPTX 파싱, 스타일 추출/적용 모듈
 
 import copy
 import logging
+from functools import lru_cache
 from typing import Any
 from pptx import Presentation
 from pptx.util import Pt, Emu
-from pptx.dml.color import RGBColor
 from pptx.oxml.ns import qn
+from pptx.shapes.group import GroupShape
 from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# 자주 쓰는 네임스페이스 태그 — run마다 qn()을 다시 호출하지 않도록 1회 계산
+_QN_P = qn('a:p')
+_QN_R = qn('a:r')
+_QN_RPR = qn('a:rPr')
+_QN_T = qn('a:t')
+_QN_LATIN = qn('a:latin')
+_QN_EA = qn('a:ea')
+_QN_CS = qn('a:cs')
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# 폰트 요소 삽입 위치 (OOXML 스키마 순서 latin → ea → cs)
+# 태그 → (뒤에 와야 할 요소: 있으면 그 앞에 삽입, 앞에 와야 할 요소: 가까운 순, 있으면 그 뒤에 삽입)
+_FONT_INSERT_PLAN = {
+    _QN_LATIN: ((_QN_EA, _QN_CS), ()),
+    _QN_EA: ((_QN_CS,), (_QN_LATIN,)),
+    _QN_CS: ((), (_QN_EA, _QN_LATIN)),
+}
+
+NSMAP = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+
+# <a:rPr> 속성값 변환 (python-pptx Font 프로퍼티와 같은 결과)
+_EMU_PER_CENTIPOINT = 127  # sz는 1/100pt 단위, 1pt = 12700 EMU
+_XSD_BOOL = {'1': True, 'true': True, '0': False, 'false': False}
+_UNDERLINE_BOOL = {'none': False, 'sng': True}
+
+# <a:rPr> 색상 조회용 컴파일된 XPath (lxml C 레벨에서 실행)
+_FIND_SOLID = etree.XPath('a:solidFill', namespaces=NSMAP)
+_SOLID_RGB = etree.XPath('a:srgbClr/@val', namespaces=NSMAP)
+_HAS_GRAD = etree.XPath('boolean(a:gradFill)', namespaces=NSMAP)
+# 그라데이션 첫 번째 정지점(gs)의 srgbClr 값만 조회 — 하위 트리 전체(//)를 훑어 모든 gs를
+# 모으지 않고 스키마 경로(gradFill/gsLst/gs)의 첫 자식에서 바로 멈춤
+_GRAD_FIRST_RGB = etree.XPath('a:gradFill/a:gsLst/a:gs[1]/a:srgbClr/@val', namespaces=NSMAP)
+
 
 # ──────────────────────────────────────────────
 #  스타일 추출 / 비교 헬퍼
 # ──────────────────────────────────────────────
 
-def _extract_run_style(run) -> dict:
-    """Run의 서식 속성을 딕셔너리로 추출합니다."""
-    font = run.font
+def _extract_run_style(rPr) -> dict:
+    """Run의 <a:rPr> 요소에서 서식 속성을 딕셔너리로 추출합니다."""
     style: dict[str, Any] = {}
 
-    # 기본 속성
-    if font.name is not None:
-        style["name"] = font.name
-    if font.size is not None:
-        style["size"] = font.size  # EMU 단위 정수
-    if font.bold is not None:
-        style["bold"] = font.bold
-    if font.italic is not None:
-        style["italic"] = font.italic
-    if font.underline is not None:
-        style["underline"] = font.underline
+    # 기본 속성 — python-pptx Font 래퍼 없이 속성을 직접 읽음 (값은 Font와 동일하게 변환)
+    latin = rPr.find(_QN_LATIN)
+    if latin is not None and latin.get('typeface') is not None:
+        style["name"] = latin.get('typeface')
+    sz = rPr.get('sz')
+    if sz is not None:
+        style["size"] = int(sz) * _EMU_PER_CENTIPOINT  # EMU 단위 정수
+    for attr, key in (('b', "bold"), ('i', "italic")):
+        val = rPr.get(attr)
+        if val is not None:
+            style[key] = _XSD_BOOL[val]
+    u = rPr.get('u')
+    if u is not None:
+        # Font.underline과 같이 none/sng는 bool, 그 외(dbl, wavy 등)는 종류 문자열 그대로
+        style["underline"] = _UNDERLINE_BOOL.get(u, u)
 
     # 색상 — XML에서 직접 읽기 (python-pptx font.color 접근 시 gradFill이 파괴됨)
     try:
-        rPr = run._r.find(qn('a:rPr'))
-        if rPr is not None:
-            solid = rPr.find(qn('a:solidFill'))
-            grad = rPr.find(qn('a:gradFill'))
-            if solid is not None:
-                srgb = solid.find(qn('a:srgbClr'))
-                if srgb is not None:
-                    style["color_rgb"] = srgb.get('val')
-                    style["color_type"] = "solid"
-            elif grad is not None:
-                # 그라데이션은 첫번째 색상만 참고용으로 추출
-                gs_list = grad.findall(f'.//{qn("a:gs")}')
-                if gs_list:
-                    srgb = gs_list[0].find(qn('a:srgbClr'))
-                    if srgb is not None:
-                        style["color_rgb"] = srgb.get('val')
-                style["color_type"] = "gradient"
+        solid = _FIND_SOLID(rPr)
+        if solid:
+            rgb = _SOLID_RGB(solid[0])
+            if rgb:
+                style["color_rgb"] = str(rgb[0])
+                style["color_type"] = "solid"
+        elif _HAS_GRAD(rPr):
+            # 그라데이션은 첫번째 색상만 참고용으로 추출
+            rgb = _GRAD_FIRST_RGB(rPr)
+            if rgb:
+                style["color_rgb"] = str(rgb[0])
+            style["color_type"] = "gradient"
     except (AttributeError, TypeError):
         pass
 
-    # 언어 ID — python-pptx에 매핑 없는 로케일(en-IN 등) 시 ValueError 발생
-    try:
-        if font.language_id is not None:
-            style["language_id"] = font.language_id
-    except Exception:
-        pass
+    # 언어 ID — lang 속성을 직접 읽음 (font.language_id는 매핑 없는 로케일(en-IN 등)에서 ValueError)
+    lang = rPr.get('lang')
+    if lang is not None:
+        style["language_id"] = lang
 
     return style
 
 
-def _style_key(style: dict) -> str:
-    """스타일 딕셔너리를 비교 가능한 해시 키로 변환합니다."""
-    items = sorted(style.items(), key=lambda x: x[0])
-    return str(items)
+@lru_cache(maxsize=4096)
+def _style_for_rpr_bytes(rpr_bytes: bytes) -> tuple[dict, frozenset]:
+    """
+    정규화(c14n)된 <a:rPr> 바이트 → (스타일 dict, 중복 제거용 키).
+    덱 전체에서 서로 다른 rPr은 수십 개 수준이므로 같은 서식의 run은 파싱 없이 같은 객체를 재사용합니다.
+    반환된 dict는 여러 run/텍스트 프레임이 공유하므로 수정하지 않습니다.
+    """
+    style = _extract_run_style(etree.fromstring(rpr_bytes))
+    return style, frozenset(style.items())  # 값은 모두 hashable (str/int/bool)
 
 
 def _extract_paragraph_style(paragraph) -> dict:
@@ -101,46 +136,72 @@ def _extract_paragraph_style(paragraph) -> dict:
 #  슬라이드 맥락 추출
 # ──────────────────────────────────────────────
 
-def extract_slide_context(slide) -> str:
-    """슬라이드의 모든 텍스트를 추출하여 맥락 문자열로 반환합니다."""
-    texts = []
-    for shape in slide.shapes:
-        texts.extend(_extract_shape_texts(shape))
-    return "\n".join(texts)
-
-
-def _extract_shape_texts(shape) -> list[str]:
-    """Shape에서 텍스트를 재귀적으로 추출합니다."""
-    texts = []
-    # 그룹 Shape 재귀 처리
-    if shape.shape_type == 6:  # MSO_SHAPE_TYPE.GROUP
-        for child_shape in shape.shapes:
-            texts.extend(_extract_shape_texts(child_shape))
-        return texts
-
-    if shape.has_text_frame:
-        for para in shape.text_frame.paragraphs:
-            para_text = para.text.strip()
-            if para_text:
-                texts.append(para_text)
-
-    if shape.has_table:
-        for row in shape.table.rows:
-            for cell in row.cells:
-                for para in cell.text_frame.paragraphs:
-                    para_text = para.text.strip()
-                    if para_text:
-                        texts.append(para_text)
-    return texts
+class _LazyContext:
+    """
+    슬라이드 텍스트를 실제로 사용할 때까지 추출을 미루는 맥락 객체.
+    str()로 전체 텍스트를 만들고(1회 후 캐시), bool()은 첫 텍스트를 찾는 즉시 반환합니다.
+    """
+
+    __slots__ = ("_slide", "_text")
+
+    def __init__(self, slide):
+        self._slide = slide
+        self._text: str | None = None
+
+    def _iter_texts(self):
+        # 그룹은 _iter_shapes_recursive의 반복자 스택으로 평탄화 — 그룹마다 generator/리스트를 만들지 않음
+        for shape, shape_type in _iter_shapes_recursive(self._slide.shapes):
+            if shape_type == "text_frame":
+                yield from _iter_paragraph_texts(shape.text_frame.paragraphs)
+            else:
+                for row in shape.table.rows:
+                    for cell in row.cells:
+                        yield from _iter_paragraph_texts(cell.text_frame.paragraphs)
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self._iter_texts())
+        return self._text
+
+    def __bool__(self) -> bool:
+        if self._text is not None:
+            return bool(self._text)
+        return next(self._iter_texts(), None) is not None
+
+
+def extract_slide_context(slide) -> _LazyContext:
+    """슬라이드의 모든 텍스트를 맥락 문자열로 반환합니다 (str() 시점에 추출)."""
+    return _LazyContext(slide)
+
+
+def _iter_paragraph_texts(paragraphs):
+    """공백이 아닌 paragraph 텍스트를 앞뒤 공백을 제거하여 순서대로 반환합니다."""
+    for para in paragraphs:
+        para_text = para.text
+        if para_text and not para_text.isspace():
+            # 대부분 앞뒤 공백이 없으므로 양 끝이 공백일 때만 strip() (새 문자열 할당 생략)
+            if para_text[0].isspace() or para_text[-1].isspace():
+                para_text = para_text.strip()
+            yield para_text
 
 
 # ──────────────────────────────────────────────
 #  스타일 ID 매핑 + 텍스트 추출
 # ──────────────────────────────────────────────
 
+# 공백이 아닌 <a:t>가 하나라도 있는지 (run 텍스트를 이어 붙이지 않고 XML 수준에서 판별)
+_HAS_TEXT = etree.XPath("boolean(.//a:t[normalize-space(text())])", namespaces=NSMAP)
+
+
+def has_text(text_frame) -> bool:
+    """텍스트 프레임에 공백 외의 텍스트가 있는지 확인합니다 (빈 플레이스홀더 사전 필터용)."""
+    return _HAS_TEXT(text_frame._txBody)
+
+
 def extract_styled_paragraphs(text_frame) -> dict | None:
     """
     TextFrame에서 paragraph/run 구조와 스타일 매핑을 추출합니다.
+    python-pptx의 Paragraph/Run 래퍼를 만들지 않고 <a:p>/<a:r> 요소를 직접 순회합니다.
 
     Returns:
         {
@@ -151,26 +212,34 @@ def extract_styled_paragraphs(text_frame) -> dict | None:
                     "runs": [{"text": "Hello", "style_id": "S0"}, ...]
                 },
                 ...
-            ]
+            ],
+            "flat_text": "Hello ...",  # 모든 run 텍스트를 공백으로 이은 문자열
+            "run_elems": [[(<a:r>, <a:t>), ...], ...]  # p_idx별 run 요소 (적용 시 재탐색 방지)
         }
         텍스트가 없으면 None 반환.
     """
     styles_map: dict[str, dict] = {}
     rPr_xml_map: dict[str, Any] = {}  # style_id → <a:rPr> XML deep copy
-    key_to_id: dict[str, str] = {}
+    key_to_id: dict[frozenset, str] = {}  # 스타일 (키, 값) 집합 → style_id
     style_counter = 0
     paragraphs_data = []
+    run_texts: list[str] = []  # flat_text 생성용 (이후 재순회 방지)
+    run_elems: list[list[tuple]] = []  # p_idx → [(r_elem, t_elem), ...]
     has_text = False
 
-    for p_idx, paragraph in enumerate(text_frame.paragraphs):
+    for p_idx, p_elem in enumerate(text_frame._txBody.iterchildren(_QN_P)):
         runs_data = []
-        for run in paragraph.runs:
-            text = run.text
+        para_elems = []
+        for r_elem in p_elem.iterchildren(_QN_R):
+            t_elem = r_elem.find(_QN_T)
+            text = t_elem.text or ""  # <a:t/>이면 None
+            para_elems.append((r_elem, t_elem))
             if text:
                 has_text = True
 
-            rs = _extract_run_style(run)
-            sk = _style_key(rs)
+            # run.font와 동일하게 <a:rPr>가 없으면 추가 (대상 폰트 설정 대상이 되도록)
+            rPr = r_elem.get_or_add_rPr()
+            rs, sk = _style_for_rpr_bytes(etree.tostring(rPr, method="c14n"))
 
             if sk not in key_to_id:
                 sid = f"S{style_counter}"
@@ -180,31 +249,34 @@ def extract_styled_paragraphs(text_frame) -> dict | None:
 
             sid = key_to_id[sk]
 
-            # <a:rPr> XML deep copy 보존 (스타일 재배치용)
-            rPr = run._r.find(qn('a:rPr'))
-            rPr_copy = copy.deepcopy(rPr) if rPr is not None else None
-            if sid not in rPr_xml_map and rPr_copy is not None:
-                rPr_xml_map[sid] = rPr_copy
+            # <a:rPr> XML deep copy 보존 (스타일 재배치용) — style_id별 첫 run만 복사
+            if sid not in rPr_xml_map:
+                rPr_xml_map[sid] = copy.deepcopy(rPr)
 
             runs_data.append({
                 "text": text,
                 "style_id": sid,
             })
+            run_texts.append(text)
 
-        # Run이 없는 경우(순수 텍스트가 paragraph에 직접 있는 경우)
-        if not runs_data and paragraph.text.strip():
-            has_text = True
-            runs_data.append({
-                "text": paragraph.text,
-                "style_id": "S0",
-            })
-            if "S0" not in styles_map:
-                styles_map["S0"] = {}
+        # Run이 없는 경우(필드·줄바꿈 등 텍스트가 paragraph에 직접 있는 경우)
+        if not runs_data:
+            p_text = p_elem.text  # CT_TextParagraph.text — a:r/a:br/a:fld 텍스트
+            if p_text.strip():
+                has_text = True
+                runs_data.append({
+                    "text": p_text,
+                    "style_id": "S0",
+                })
+                run_texts.append(p_text)
+                if "S0" not in styles_map:
+                    styles_map["S0"] = {}
 
         paragraphs_data.append({
             "p_idx": p_idx,
             "runs": runs_data,
         })
+        run_elems.append(para_elems)
 
     if not has_text:
         return None
@@ -213,6 +285,8 @@ def extract_styled_paragraphs(text_frame) -> dict | None:
         "styles": styles_map,
         "rPr_xml_map": rPr_xml_map,
         "paragraphs": paragraphs_data,
+        "flat_text": " ".join(run_texts),
+        "run_elems": run_elems,
     }
 
 
@@ -235,20 +309,21 @@ LANG_FONT_MAP = {
 }
 
 # 스크립트 유형별 언어 분류 (→ OOXML 폰트 요소 결정)
-EAST_ASIAN_LANGS = {"ko", "ja", "zh"}
-COMPLEX_SCRIPT_LANGS = {"ar", "th"}
-LATIN_OVERRIDE_LANGS = {"ru", "vi"}
+EAST_ASIAN_LANGS = frozenset({"ko", "ja", "zh"})
+COMPLEX_SCRIPT_LANGS = frozenset({"ar", "th"})
+LATIN_OVERRIDE_LANGS = frozenset({"ru", "vi"})
+
+# 언어 코드 → 네임스페이스가 붙은 폰트 요소 태그 (run마다 분기하지 않고 dict 조회 1회)
+_LANG_TO_FONT_TAG = {
+    **{lang: _QN_EA for lang in EAST_ASIAN_LANGS},
+    **{lang: _QN_CS for lang in COMPLEX_SCRIPT_LANGS},
+    **{lang: _QN_LATIN for lang in LATIN_OVERRIDE_LANGS},
+}
 
 
 def _font_element_tag(target_lang: str) -> str | None:
-    """대상 언어에 맞는 OOXML 폰트 요소 태그를 반환합니다."""
-    if target_lang in EAST_ASIAN_LANGS:
-        return "a:ea"
-    if target_lang in COMPLEX_SCRIPT_LANGS:
-        return "a:cs"
-    if target_lang in LATIN_OVERRIDE_LANGS:
-        return "a:latin"
-    return None
+    """대상 언어에 맞는 OOXML 폰트 요소 태그(네임스페이스 포함)를 반환합니다."""
+    return _LANG_TO_FONT_TAG.get(target_lang)
 
 
 def get_target_font(target_lang: str) -> str | None:
@@ -261,25 +336,25 @@ def get_target_font(target_lang: str) -> str | None:
 # ──────────────────────────────────────────────
 
 
-def _replace_run_text_xml(run, new_text):
+def _replace_run_text_xml(r_elem, new_text, t_elem=None):
     """
-    Run의 텍스트를 XML 레벨에서 직접 교체합니다.
+    Run(<a:r> 요소)의 텍스트를 XML 레벨에서 직접 교체합니다.
     <a:rPr> 등 서식 요소를 일체 건드리지 않으므로 서식이 100% 보존됩니다.
+    추출 단계에서 찾아 둔 <a:t>를 t_elem으로 넘기면 다시 탐색하지 않습니다.
     """
-    r_elem = run._r
-    t_elem = r_elem.find(qn('a:t'))
+    if t_elem is None:
+        t_elem = r_elem.find(_QN_T)
     if t_elem is not None:
         t_elem.text = new_text
     else:
         # <a:t>가 없는 경우 새로 생성
-        t_elem = etree.SubElement(r_elem, qn('a:t'))
-        t_elem.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
+        t_elem = etree.SubElement(r_elem, _QN_T, attrib={_XML_SPACE: 'preserve'})
         t_elem.text = new_text
 
 
-def _set_run_target_font(run, target_font, target_lang):
+def _set_run_target_font(r_elem, target_font, target_lang):
     """
-    Run에 대상 언어의 스크립트 유형에 맞는 폰트 요소를 설정합니다.
+    Run(<a:r> 요소)에 대상 언어의 스크립트 유형에 맞는 폰트 요소를 설정합니다.
       - East Asian (ko/ja/zh)   → <a:ea>
       - Complex Script (ar/th)  → <a:cs>
       - Latin override (ru/vi)  → <a:latin>
@@ -293,24 +368,23 @@ def _set_run_target_font(run, target_font, target_lang):
     if tag is None:
         return
 
-    r_elem = run._r
-    rPr = r_elem.find(qn('a:rPr'))
+    rPr = r_elem.find(_QN_RPR)
     if rPr is None:
         return
 
     # 이미 해당 요소가 있으면 typeface만 변경
-    existing = rPr.find(qn(tag))
+    existing = rPr.find(tag)
     if existing is not None:
         existing.set('typeface', target_font)
         return
 
     # 새 요소 생성
-    new_elem = etree.Element(qn(tag))
+    new_elem = etree.Element(tag)
     new_elem.set('typeface', target_font)
 
     # <a:latin>에서 pitchFamily, charset 속성 복사 (latin 자체가 아닌 경우)
-    if tag != 'a:latin':
-        latin = rPr.find(qn('a:latin'))
+    if tag != _QN_LATIN:
+        latin = rPr.find(_QN_LATIN)
         if latin is not None:
             for attr in ('pitchFamily', 'charset'):
                 val = latin.get(attr)
@@ -318,19 +392,18 @@ def _set_run_target_font(run, target_font, target_lang):
                     new_elem.set(attr, val)
 
     # OOXML 스키마 순서에 맞게 삽입: latin → ea → cs
-    FONT_ORDER = ['a:latin', 'a:ea', 'a:cs']
-    tag_idx = FONT_ORDER.index(tag)
+    later_tags, earlier_tags = _FONT_INSERT_PLAN[tag]
 
     # 자신보다 뒤에 있는 요소를 찾아 그 앞에 삽입
-    for later_tag in FONT_ORDER[tag_idx + 1:]:
-        later = rPr.find(qn(later_tag))
+    for later_tag in later_tags:
+        later = rPr.find(later_tag)
         if later is not None:
             later.addprevious(new_elem)
             return
 
     # 자신보다 앞에 있는 요소를 찾아 그 뒤에 삽입
-    for earlier_tag in reversed(FONT_ORDER[:tag_idx]):
-        earlier = rPr.find(qn(earlier_tag))
+    for earlier_tag in earlier_tags:
+        earlier = rPr.find(earlier_tag)
         if earlier is not None:
             earlier.addnext(new_elem)
             return
@@ -339,13 +412,12 @@ def _set_run_target_font(run, target_font, target_lang):
     rPr.append(new_elem)
 
 
-def _replace_rPr_xml(run, new_rPr):
+def _replace_rPr_xml(r_elem, new_rPr):
     """
-    Run의 <a:rPr> 요소를 교체합니다.
+    Run(<a:r> 요소)의 <a:rPr> 요소를 교체합니다.
     번역 시 어순 변경으로 스타일 위치가 바뀔 때 사용됩니다.
     """
-    r_elem = run._r
-    old_rPr = r_elem.find(qn('a:rPr'))
+    old_rPr = r_elem.find(_QN_RPR)
     new_copy = copy.deepcopy(new_rPr)
     if old_rPr is not None:
         r_elem.replace(old_rPr, new_copy)
@@ -353,11 +425,11 @@ def _replace_rPr_xml(run, new_rPr):
         r_elem.insert(0, new_copy)
 
 
-def apply_translated_runs(text_frame, translated_data: dict, styles_map: dict,
-                          original_paragraphs_xml=None, styles_rPr_xml=None,
+def apply_translated_runs(text_frame, translated_data: dict,
                           target_font: str | None = None,
                           target_lang: str | None = None,
-                          rPr_xml_map: dict | None = None):
+                          rPr_xml_map: dict | None = None,
+                          run_elems: list | None = None):
     """
     번역된 데이터를 TextFrame에 적용합니다.
 
@@ -374,34 +446,46 @@ def apply_translated_runs(text_frame, translated_data: dict, styles_map: dict,
     Args:
         text_frame: python-pptx TextFrame 객체
         translated_data: {"paragraphs": [{"runs": [{"text": "...", "style_id": "S0"}, ...]}]}
-        styles_map: 스타일 ID → 속성 매핑
         rPr_xml_map: style_id → <a:rPr> XML deep copy (스타일 재배치용)
         target_font: 대상 언어 폰트
         target_lang: 대상 언어 코드
+        run_elems: extract_styled_paragraphs()의 run_elems (없으면 XML을 다시 순회)
     """
     translated_paras = translated_data.get("paragraphs", [])
-    orig_paragraphs = list(text_frame.paragraphs)
+    n_translated = len(translated_paras)
 
-    for p_idx, paragraph in enumerate(orig_paragraphs):
-        orig_runs = list(paragraph.runs)
-        if not orig_runs:
-            continue
+    # 추출 시 찾아 둔 (<a:r>, <a:t>) 목록을 사용 — 없으면 <a:p>/<a:r> 요소를 직접 순회
+    if run_elems is None:
+        run_elems = [
+            [(r_elem, r_elem.find(_QN_T)) for r_elem in p_elem.iterchildren(_QN_R)]
+            for p_elem in text_frame._txBody.iterchildren(_QN_P)
+        ]
 
-        if p_idx < len(translated_paras):
-            t_para = translated_paras[p_idx]
-            t_runs = t_para.get("runs", [])
-            full_translated = "".join(r.get("text", "") for r in t_runs)
-        else:
+    # 대상 언어에 설정할 폰트 요소가 없으면(en 등) run마다 _set_run_target_font를 호출하지 않음
+    apply_font = bool(target_font) and _font_element_tag(target_lang) is not None
+
+    for p_idx, orig_runs in enumerate(run_elems):
+        if p_idx >= n_translated:
+            break
+        if not orig_runs:
             continue
 
-        if not full_translated and not any(r.get("text", "") for r in t_runs):
+        t_runs = translated_paras[p_idx].get("runs", [])
+        # 이어 붙인 결과가 비어 있으면 비어 있지 않은 run도 없음 → 한 번의 순회로 판별
+        full_translated = "".join([r.get("text") or "" for r in t_runs])
+        if not full_translated:
             continue
 
-        if len(t_runs) == len(orig_runs):
+        n_orig = len(orig_runs)
+        if len(t_runs) == n_orig:
             # ── Run 수 동일: 텍스트 교체 + style_id에 맞는 rPr 적용 ──
-            for i, (orig_run, t_run) in enumerate(zip(orig_runs, t_runs)):
+            for (orig_run, t_elem), t_run in zip(orig_runs, t_runs):
                 new_text = t_run.get("text", "")
-                _replace_run_text_xml(orig_run, new_text)
+                # 미리 찾아 둔 <a:t>에 바로 대입 (없을 때만 생성 경로)
+                if t_elem is not None:
+                    t_elem.text = new_text
+                else:
+                    _replace_run_text_xml(orig_run, new_text)
 
                 # rPr_xml_map이 있으면 번역 결과의 style_id에 맞게 rPr 적용
                 # → 어순 변경으로 스타일 위치가 바뀌어도 정확한 서식 유지
@@ -409,19 +493,20 @@ def apply_translated_runs(text_frame, translated_data: dict, styles_map: dict,
                 if rPr_xml_map and t_sid and t_sid in rPr_xml_map:
                     _replace_rPr_xml(orig_run, rPr_xml_map[t_sid])
 
-                if target_font and new_text:
+                if apply_font and new_text:
                     _set_run_target_font(orig_run, target_font, target_lang)
 
-            logger.debug(f"  P{p_idx}: 1:1 Run 매핑 ({len(orig_runs)}개)")
+            logger.debug(f"  P{p_idx}: 1:1 Run 매핑 ({n_orig}개)")
         else:
             # ── Run 수 다름 → 첫 번째 Run에 전체 텍스트, 나머지 비움 ──
-            _replace_run_text_xml(orig_runs[0], full_translated)
-            if target_font and full_translated:
-                _set_run_target_font(orig_runs[0], target_font, target_lang)
-            for run in orig_runs[1:]:
-                _replace_run_text_xml(run, "")
+            first_run, first_t = orig_runs[0]
+            _replace_run_text_xml(first_run, full_translated, first_t)
+            if apply_font:
+                _set_run_target_font(first_run, target_font, target_lang)
+            for r_elem, t_elem in orig_runs[1:]:
+                _replace_run_text_xml(r_elem, "", t_elem)
             logger.debug(
-                f"  P{p_idx}: 통합 교체 (원본 {len(orig_runs)}개 Run → "
+                f"  P{p_idx}: 통합 교체 (원본 {n_orig}개 Run → "
                 f"번역 {len(t_runs)}개, 첫 Run에 통합)"
             )
 
@@ -439,26 +524,27 @@ def iter_translatable_shapes(slide):
 
 
 def _iter_shapes_recursive(shapes):
-    """Shape 컬렉션을 재귀적으로 순회합니다."""
-    for shape in shapes:
-        # 그룹 Shape
-        if shape.shape_type == 6:  # MSO_SHAPE_TYPE.GROUP
+    """
+    Shape 컬렉션을 그룹 포함 깊이 우선으로 순회합니다.
+    그룹마다 generator를 중첩하지 않고 반복자 스택 하나로 처리합니다 (중첩 깊이와 무관하게 프레임 1개).
+    """
+    stack = [iter(shapes)]
+    while stack:
+        shape = next(stack[-1], None)
+        if shape is None:
+            stack.pop()
+            continue
+
+        # 그룹 Shape (shape_type 대신 타입으로 판별 — XML 검사 생략)
+        if isinstance(shape, GroupShape):
             try:
-                yield from _iter_shapes_recursive(shape.shapes)
+                stack.append(iter(shape.shapes))
             except AttributeError:
                 pass
             continue
 
+        # 텍스트 프레임과 테이블은 동시에 가질 수 없으므로 하나만 확인
         if shape.has_text_frame:
             yield (shape, "text_frame")
-        if shape.has_table:
+        elif shape.has_table:
             yield (shape, "table")
-
-
-# ──────────────────────────────────────────────
-#  원본 paragraph XML 백업/복원 유틸
-# ──────────────────────────────────────────────
-
-def backup_paragraph_xml(text_frame) -> list:
-    """하위 호환용 — 새 방식에서는 사용하지 않습니다."""
-    return []
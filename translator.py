@@ -4,12 +4,27 @@ translator.py — Azure OpenAI GPT 기반 번역 엔진
 슬라이드 맥락 파악 + Run 수준 스타일 보존 번역을 수행합니다.
 """
 
-import json
+import asyncio
+import copy
+import gzip
+import hashlib
 import os
+import random
 import time
 import logging
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 
-from openai import AzureOpenAI
+import orjson
+from openai import (
+    APITimeoutError, AsyncAzureOpenAI, AuthenticationError, AzureOpenAI, BadRequestError,
+    DefaultAsyncHttpxClient, NotFoundError, PermissionDeniedError, RateLimitError,
+    UnprocessableEntityError,
+)
+
+from cache import TranslationCache, get_cache_dir
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +32,8 @@ logger = logging.getLogger(__name__)
 #  언어 코드 → 이름 매핑
 # ──────────────────────────────────────────────
 
-LANG_MAP = {
+# 읽기 전용 — 실행 중 수정되면 get_lang_name() 캐시와 어긋나므로 MappingProxyType으로 고정
+LANG_MAP = MappingProxyType({
     "ko": "한국어 (Korean)",
     "ja": "日本語 (Japanese)",
     "zh": "中文 (Chinese)",
@@ -32,9 +48,10 @@ LANG_MAP = {
     "id": "Bahasa Indonesia (Indonesian)",
     "ru": "Русский (Russian)",
     "ar": "العربية (Arabic)",
-}
+})
 
 
+@lru_cache(maxsize=32)
 def get_lang_name(code: str) -> str:
     """언어 코드를 사람 읽기 가능한 이름으로 변환합니다."""
     return LANG_MAP.get(code, code)
@@ -45,28 +62,107 @@ def get_lang_name(code: str) -> str:
 # ──────────────────────────────────────────────
 
 _client: AzureOpenAI | None = None
+_async_client: AsyncAzureOpenAI | None = None
+_async_client_loop = None
+_fallback_client: AsyncAzureOpenAI | None = None
+_fallback_client_loop = None
+
+
+def _client_kwargs() -> dict:
+    """환경변수에서 Azure OpenAI 클라이언트 생성 인자를 읽습니다."""
+    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+    api_key = os.getenv("AZURE_OPENAI_API_KEY")
+    api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2025-04-01-preview")
+
+    if not endpoint or not api_key:
+        raise ValueError(
+            "AZURE_OPENAI_ENDPOINT와 AZURE_OPENAI_API_KEY 환경변수를 설정하세요. "
+            ".env.example을 참고하여 .env 파일을 생성하세요."
+        )
+
+    return {
+        "azure_endpoint": endpoint,
+        "api_key": api_key,
+        "api_version": api_version,
+    }
+
+
+GZIP_MIN_BYTES = 2048  # 이보다 작은 요청 본문은 압축 이득이 적어 그대로 전송
+
+
+def _gzip_enabled() -> bool:
+    """AZURE_OPENAI_GZIP_REQUESTS=1이면 비동기 호출의 요청 본문을 gzip으로 압축합니다."""
+    return os.getenv("AZURE_OPENAI_GZIP_REQUESTS", "").lower() in ("1", "true", "yes")
+
+
+async def _gzip_request(request) -> None:
+    """
+    httpx request 이벤트 훅: 본문이 GZIP_MIN_BYTES 이상이면 gzip으로 압축합니다.
+    openai 버전마다 내부 HTTP 패키지(httpx / httpx2)가 다르므로 특정 패키지를 import하지 않고,
+    전달된 요청과 같은 Request 클래스로 압축 본문 스트림을 만들어 교체합니다.
+    """
+    if request.headers.get("Content-Encoding"):
+        return
+    body = request.content
+    if len(body) < GZIP_MIN_BYTES:
+        return
+    compressed = gzip.compress(body)
+    request.stream = type(request)(request.method, request.url, content=compressed).stream
+    request.headers["Content-Encoding"] = "gzip"
+    request.headers["Content-Length"] = str(len(compressed))
 
 
 def _get_client() -> AzureOpenAI:
     """AzureOpenAI 클라이언트를 싱글톤으로 반환합니다."""
     global _client
     if _client is None:
-        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-        api_key = os.getenv("AZURE_OPENAI_API_KEY")
-        api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2025-04-01-preview")
-
-        if not endpoint or not api_key:
-            raise ValueError(
-                "AZURE_OPENAI_ENDPOINT와 AZURE_OPENAI_API_KEY 환경변수를 설정하세요. "
-                ".env.example을 참고하여 .env 파일을 생성하세요."
-            )
+        _client = AzureOpenAI(**_client_kwargs())
+    return _client
 
-        _client = AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=api_key,
-            api_version=api_version,
+
+def _new_async_client(kwargs: dict) -> AsyncAzureOpenAI:
+    """AsyncAzureOpenAI 클라이언트를 생성합니다 (gzip 설정 시 요청 훅 추가)."""
+    if _gzip_enabled():
+        # openai 기본 타임아웃·연결 한도를 유지한 채 요청 훅만 추가
+        kwargs["http_client"] = DefaultAsyncHttpxClient(
+            event_hooks={"request": [_gzip_request]},
         )
-    return _client
+    return AsyncAzureOpenAI(**kwargs)
+
+
+def _get_async_client() -> AsyncAzureOpenAI:
+    """
+    AsyncAzureOpenAI 클라이언트를 이벤트 루프별 싱글톤으로 반환합니다 (슬라이드 동시 번역용).
+    동기 래퍼가 _run_sync()로 새 루프를 여러 번 만들어도 닫힌 루프의 연결 풀을 재사용하지 않습니다.
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        _async_client = _new_async_client(_client_kwargs())
+        _async_client_loop = loop
+    return _async_client
+
+
+def _get_fallback_client() -> AsyncAzureOpenAI | None:
+    """
+    보조 엔드포인트(AZURE_OPENAI_FALLBACK_ENDPOINT / AZURE_OPENAI_FALLBACK_API_KEY) 클라이언트를
+    이벤트 루프별 싱글톤으로 반환합니다. 설정되지 않았으면 None.
+    """
+    global _fallback_client, _fallback_client_loop
+    endpoint = os.getenv("AZURE_OPENAI_FALLBACK_ENDPOINT")
+    api_key = os.getenv("AZURE_OPENAI_FALLBACK_API_KEY")
+    if not endpoint or not api_key:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _fallback_client is None or _fallback_client_loop is not loop:
+        _fallback_client = _new_async_client({
+            "azure_endpoint": endpoint,
+            "api_key": api_key,
+            "api_version": os.getenv("AZURE_OPENAI_API_VERSION", "2025-04-01-preview"),
+        })
+        _fallback_client_loop = loop
+    return _fallback_client
 
 
 def _get_deployment() -> str:
@@ -74,75 +170,461 @@ def _get_deployment() -> str:
     return os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-52")
 
 
+def _get_batch_deployment() -> str:
+    """Batch API용 배포 이름을 반환합니다 (Global Batch 배포, 미설정 시 기본 배포)."""
+    return os.getenv("AZURE_OPENAI_BATCH_DEPLOYMENT_NAME") or _get_deployment()
+
+
+def _get_fallback_deployment() -> str:
+    """보조 엔드포인트의 배포 이름을 반환합니다 (미설정 시 기본 배포 이름)."""
+    return os.getenv("AZURE_OPENAI_FALLBACK_DEPLOYMENT_NAME") or _get_deployment()
+
+
+# ──────────────────────────────────────────────
+#  호출 속도 제한 (RPM / TPM 토큰 버킷)
+# ──────────────────────────────────────────────
+
+class RateLimiter:
+    """
+    분당 요청 수(RPM)·토큰 수(TPM) 한도에 맞춰 API 호출 시작 시점을 조절합니다.
+
+    동시 실행되는 슬라이드 번역이 한도를 넘어 429를 받는 대신,
+    한도 직전의 일정한 속도로 요청을 흘려보냅니다.
+    rpm/tpm이 None이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rpm: int | None = None, tpm: int | None = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._next_slot = 0.0          # 다음 요청을 시작할 수 있는 시각 (monotonic)
+        self._tokens = float(tpm or 0)  # TPM 버킷 잔량
+        self._refilled_at = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """현재 이벤트 루프에 묶인 Lock을 반환합니다 (asyncio.run 재호출 대응)."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """요청 1건(예상 토큰 tokens개)을 보낼 수 있을 때까지 대기합니다."""
+        if not self.rpm and not self.tpm:
+            return
+
+        async with self._get_lock():
+            # penalize()로 미뤄진 시작 시각은 RPM 설정 여부와 관계없이 지킴
+            now = time.monotonic()
+            wait = self._next_slot - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = time.monotonic()
+            if self.rpm:
+                self._next_slot = max(now, self._next_slot) + 60 / self.rpm
+
+            if self.tpm:
+                need = min(tokens, self.tpm)
+                self._refill(now)
+                if self._tokens < need:
+                    await asyncio.sleep((need - self._tokens) * 60 / self.tpm)
+                    self._refill(time.monotonic())
+                self._tokens -= need
+
+    def penalize(self, seconds: float) -> None:
+        """429 응답 시 모든 대기 요청의 시작을 seconds초 뒤로 미룹니다."""
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+_rate_limiter = RateLimiter()
+
+
+def configure_rate_limit(rpm: int | None = None, tpm: int | None = None) -> None:
+    """비동기 API 호출의 RPM/TPM 한도를 설정합니다. None이면 제한 없음."""
+    global _rate_limiter
+    _rate_limiter = RateLimiter(rpm=rpm, tpm=tpm)
+
+
+def _estimate_tokens(messages: list[dict]) -> int:
+    """메시지의 입력 토큰 수를 대략 추정합니다 (문자 3개 ≈ 1토큰)."""
+    return sum(len(m.get("content") or "") for m in messages) // 3
+
+
+# ──────────────────────────────────────────────
+#  동시 요청 수 제한 (Semaphore)
+# ──────────────────────────────────────────────
+
+DEFAULT_MAX_CONCURRENCY = 8
+CONTEXT_CONCURRENCY = 2  # 요약·맥락 호출 전용 (번역 호출 슬롯을 차지하지 않도록 분리)
+
+
+def _max_concurrency() -> int:
+    """AZURE_OPENAI_MAX_CONCURRENCY(기본 8)를 읽습니다 — main.py가 .env를 로드한 뒤 호출되도록 지연 평가."""
+    return int(os.getenv("AZURE_OPENAI_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))
+
+
+class _LoopSemaphore:
+    """
+    이벤트 루프별로 생성되는 asyncio.Semaphore (asyncio.run 재호출 대응).
+    limit이 None이면 첫 get() 시점에 환경변수에서 한도를 읽습니다.
+    """
+
+    def __init__(self, limit: int | None):
+        self.limit = None if limit is None else max(1, limit)
+        self._sem: asyncio.Semaphore | None = None
+        self._loop = None
+
+    def get(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._loop is not loop:
+            if self.limit is None:
+                self.limit = max(1, _max_concurrency())
+            self._sem = asyncio.Semaphore(self.limit)
+            self._loop = loop
+        return self._sem
+
+
+_SEM = _LoopSemaphore(None)
+_CONTEXT_SEM = _LoopSemaphore(CONTEXT_CONCURRENCY)
+
+
+def set_concurrency(n: int, context: int | None = None) -> None:
+    """
+    동시에 진행할 수 있는 API 요청 수를 설정합니다.
+    main.py의 --concurrency(동시 번역 슬라이드 그룹 수)와 별개로 HTTP 요청 수 자체를 제한합니다.
+
+    Args:
+        n: 번역 호출 최대 동시 요청 수
+        context: 요약·맥락 호출 최대 동시 요청 수 (None이면 유지)
+    """
+    global _SEM, _CONTEXT_SEM
+    _SEM = _LoopSemaphore(n)
+    if context is not None:
+        _CONTEXT_SEM = _LoopSemaphore(context)
+
+
 # ──────────────────────────────────────────────
 #  API 호출 (재시도 포함)
 # ──────────────────────────────────────────────
 
-MAX_RETRIES = 3
+def _run_sync(coro):
+    """
+    동기 래퍼에서 코루틴을 실행하고 결과를 반환합니다.
+    실행 중인 이벤트 루프가 없으면 asyncio.run(), 있으면(Jupyter, 비동기 웹 앱 등) 그 루프에서는
+    asyncio.run()을 호출할 수 없으므로 별도 스레드의 새 루프에서 실행합니다.
+    비동기 코드에서는 동기 래퍼 대신 a* 함수를 직접 await하세요.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+# 재시도 설정 (configure_retries 값 > 환경변수 > 기본값)
+# 환경변수는 main.py가 .env를 로드한 뒤의 값을 쓰도록 호출 시점에 읽음
+_RETRY_SETTINGS = {
+    "max_retries": ("AZURE_OPENAI_MAX_RETRIES", 8),
+    "initial_delay": ("AZURE_OPENAI_INITIAL_RETRY_DELAY", 2.0),  # 첫 재시도 대기 (초), 시도마다 2배
+    "max_delay": ("AZURE_OPENAI_MAX_RETRY_DELAY", 60.0),         # 지수 백오프 상한 (초)
+}
+_retry_overrides: dict[str, float] = {}
+RATE_LIMIT_FALLBACK_AFTER = 3  # 보조 엔드포인트가 있으면 429가 이 횟수만큼 반복될 때 전환
 
 
-def _call_chat(messages: list[dict], response_format: dict | None = None,
-               temperature: float = 0.3) -> str:
+def configure_retries(max_retries: int | None = None, initial_delay: float | None = None,
+                      max_delay: float | None = None) -> None:
+    """
+    API 호출 재시도 횟수와 백오프 대기 시간을 설정합니다. None인 항목은 유지합니다.
+    기본값은 AZURE_OPENAI_MAX_RETRIES / AZURE_OPENAI_INITIAL_RETRY_DELAY / AZURE_OPENAI_MAX_RETRY_DELAY.
     """
-    Azure OpenAI Chat Completions API를 호출합니다.
-    429 에러 시 retry-after 기반 재시도를 수행합니다.
+    for name, value in (("max_retries", max_retries), ("initial_delay", initial_delay),
+                        ("max_delay", max_delay)):
+        if value is not None:
+            _retry_overrides[name] = value
+
+
+def _retry_setting(name: str) -> float:
+    """재시도 설정값을 반환합니다 (configure_retries 값 > 환경변수 > 기본값)."""
+    if name in _retry_overrides:
+        return _retry_overrides[name]
+    env, default = _RETRY_SETTINGS[name]
+    value = os.getenv(env)
+    return type(default)(value) if value else default
+
+
+def _retry_delay(e: Exception, attempt: int) -> float:
+    """
+    재시도 전 대기 시간(초)을 계산합니다.
+    응답에 retry-after-ms / retry-after 헤더가 있으면 그 값을 따르고,
+    없으면 지터를 더한 지수 백오프를 사용합니다 (동시 재시도 몰림 방지).
+    어느 경우든 max_delay(configure_retries)를 넘지 않습니다.
+    """
+    max_delay = _retry_setting("max_delay")
+    response = getattr(e, "response", None)
+    if response is not None:
+        try:
+            ra_ms = response.headers.get("retry-after-ms")
+            if ra_ms:
+                return min(max_delay, float(ra_ms) / 1000)
+            ra = response.headers.get("retry-after")
+            if ra:
+                return min(max_delay, float(ra))
+        except (AttributeError, ValueError):
+            pass
+    base = _retry_setting("initial_delay") * 2 ** attempt
+    return min(max_delay, base + random.uniform(0, base / 2))
+
+
+# 재시도해도 결과가 같은 오류 — 400(입력 한도 초과 등)·401·403·404(배포 이름 오류)·422
+_NON_RETRYABLE_ERRORS = (
+    BadRequestError, AuthenticationError, PermissionDeniedError, NotFoundError,
+    UnprocessableEntityError,
+)
+
+
+async def _acall_chat(messages: list[dict], response_format: dict | None = None,
+                      temperature: float = 0.3, context_call: bool = False) -> str:
+    """
+    Azure OpenAI Chat Completions API를 비동기로 호출합니다.
+    429·타임아웃 시 retry-after 헤더 또는 지수 백오프(지터 포함)로 재시도합니다 (횟수·대기는 configure_retries).
     GPT-5.2 모델의 추론(reasoning)을 비활성화합니다.
+    대기 중에는 이벤트 루프를 양보하므로 여러 슬라이드를 동시에 번역할 수 있습니다.
+    동시 요청 수는 _SEM(요약·맥락 호출은 context_call=True로 _CONTEXT_SEM)으로 제한합니다.
+    보조 엔드포인트가 설정되어 있으면 429가 RATE_LIMIT_FALLBACK_AFTER회 반복될 때
+    대기 없이 보조 엔드포인트로 전환합니다.
     """
-    client = _get_client()
+    client = _get_async_client()
+    sem = (_CONTEXT_SEM if context_call else _SEM).get()
     deployment = _get_deployment()
+    backend = "primary"
+    rate_limit_hits = 0
+    max_retries = max(1, int(_retry_setting("max_retries")))
 
-    for attempt in range(MAX_RETRIES):
+    for attempt in range(max_retries):
         try:
             kwargs = {
                 "model": deployment,
                 "messages": messages,
                 "temperature": temperature,
                 "reasoning_effort": "none",
+                "stream": True,
             }
             if response_format:
                 kwargs["response_format"] = response_format
 
-            response = client.chat.completions.create(**kwargs)
-            return response.choices[0].message.content
-
-        except Exception as e:
-            error_str = str(e)
-            # Rate limit 처리
-            if "429" in error_str or "rate" in error_str.lower():
-                retry_after = 10 * (attempt + 1)  # 점진적 대기
-                # retry-after 헤더 파싱 시도
-                try:
-                    if hasattr(e, "response") and e.response is not None:
-                        ra = e.response.headers.get("retry-after")
-                        if ra:
-                            retry_after = int(ra)
-                except (AttributeError, ValueError):
-                    pass
+            await _rate_limiter.acquire(_estimate_tokens(messages))
+            # 스트리밍 수신: 토큰이 도착하는 동안 다른 슬라이드 작업이 진행되고,
+            # 스트림 도중 오류도 즉시 재시도 경로로 넘어감. JSON은 전체를 모은 뒤 한 번에 파싱
+            parts: list[str] = []
+            # 청크 수신 중 오류·취소 시에도 스트림(HTTP 연결)을 닫고 나서 세마포어 반환
+            async with sem, await client.chat.completions.create(**kwargs) as stream:
+                async for chunk in stream:
+                    if chunk.choices:  # Azure는 콘텐츠 필터 결과만 담은 빈 choices 청크를 보내기도 함
+                        parts.append(chunk.choices[0].delta.content or "")
+            if backend == "fallback":
+                logger.info(f"보조 엔드포인트 응답 수신 (backend={backend}, deployment={deployment})")
+            return "".join(parts)
+
+        except (RateLimitError, APITimeoutError) as e:
+            if attempt == max_retries - 1:
+                logger.error(f"API 호출 실패 (최대 재시도 초과): {e}")
+                raise
+            if isinstance(e, RateLimitError):
+                rate_limit_hits += 1
+                fallback = _get_fallback_client() if backend == "primary" else None
+                if fallback is not None and rate_limit_hits >= RATE_LIMIT_FALLBACK_AFTER:
+                    # 재시도 대기 대신 보조 엔드포인트로 즉시 재요청
+                    client, deployment, backend = fallback, _get_fallback_deployment(), "fallback"
+                    logger.warning(
+                        f"Rate limit {rate_limit_hits}회 — 보조 엔드포인트로 전환 "
+                        f"(backend={backend}, 시도 {attempt + 1}/{max_retries})"
+                    )
+                    continue
+            retry_after = _retry_delay(e, attempt)
+            if isinstance(e, RateLimitError):
+                logger.warning(
+                    f"Rate limit 도달. {retry_after:.1f}초 후 재시도... "
+                    f"(시도 {attempt + 1}/{max_retries})"
+                )
+                _rate_limiter.penalize(retry_after)
+            else:
                 logger.warning(
-                    f"Rate limit 도달. {retry_after}초 후 재시도... "
-                    f"(시도 {attempt + 1}/{MAX_RETRIES})"
+                    f"API 응답 시간 초과. {retry_after:.1f}초 후 재시도... "
+                    f"(시도 {attempt + 1}/{max_retries})"
                 )
-                time.sleep(retry_after)
-                continue
+            await asyncio.sleep(retry_after)
 
-            if attempt == MAX_RETRIES - 1:
+        except _NON_RETRYABLE_ERRORS as e:
+            # 키·권한·배포 이름·입력 오류는 재시도 없이 호출 측으로 전달
+            logger.error(f"API 요청 오류: {e}")
+            raise
+
+        except Exception as e:
+            if attempt == max_retries - 1:
                 logger.error(f"API 호출 실패 (최대 재시도 초과): {e}")
                 raise
-            logger.warning(f"API 호출 오류, 재시도 중... ({attempt + 1}/{MAX_RETRIES}): {e}")
-            time.sleep(2 * (attempt + 1))
+            logger.warning(f"API 호출 오류, 재시도 중... ({attempt + 1}/{max_retries}): {e}")
+            # 5xx 등 일시 오류: 지수 백오프 + 지터
+            await asyncio.sleep(_retry_delay(e, attempt))
 
     raise RuntimeError("최대 재시도 횟수 초과")
 
 
+# ──────────────────────────────────────────────
+#  번역 결과 캐시 (동일 원문 재사용)
+# ──────────────────────────────────────────────
+
+_translation_cache = TranslationCache()  # 기본: 메모리 전용
+
+
+def configure_translation_cache(persist: bool = True, path: str | None = None) -> None:
+    """
+    번역 결과 캐시를 설정합니다.
+
+    Args:
+        persist: True면 SQLite 파일에도 저장하여 다음 실행에서 재사용
+        path: SQLite 파일 경로 (기본: ~/.cache/pptx-translator/trans.sqlite)
+    """
+    global _translation_cache
+    _translation_cache.close()
+    if persist:
+        path = path or os.path.join(get_cache_dir(), "trans.sqlite")
+        _translation_cache = TranslationCache(path)
+    else:
+        _translation_cache = TranslationCache()
+
+
+def translation_cache_key(styled_data: dict, target_lang: str) -> str:
+    """
+    extract_styled_paragraphs() 결과의 캐시 키를 계산합니다.
+    모델에 전달되는 내용(paragraph/run 텍스트, style_id, 스타일 속성)만 반영합니다.
+    """
+    payload = {
+        "paragraphs": [
+            [(r["text"], r["style_id"]) for r in p["runs"]]
+            for p in styled_data["paragraphs"]
+        ],
+        "styles": styled_data["styles"],
+    }
+    raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return f"{digest}:{target_lang}"
+
+
+def simple_text_cache_key(text: str, target_lang: str) -> str:
+    """translate_simple_text() 입력의 캐시 키를 계산합니다 (공백 정규화 후 해시)."""
+    normalized = " ".join(text.split())
+    digest = hashlib.blake2b(b"simple\0" + normalized.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{digest}:{target_lang}"
+
+
+def get_cached_translation(key: str) -> dict | None:
+    """
+    캐시된 번역 결과({"paragraphs": [...]})를 반환합니다. 없으면 None.
+    호출 측에서 수정해도 캐시 원본이 바뀌지 않도록 사본을 반환합니다.
+    """
+    cached = _translation_cache.get(key)
+    if cached is None:
+        return None
+    return orjson.loads(orjson.dumps(cached))
+
+
+def cache_translation(key: str, translated: dict) -> None:
+    """번역 결과를 캐시에 저장합니다."""
+    _translation_cache.set(key, translated)
+
+
+def clear_translation_cache(persistent: bool = False) -> None:
+    """번역 결과 캐시의 메모리 항목을 비웁니다. persistent=True면 디스크 캐시도 삭제합니다."""
+    _translation_cache.clear(persistent=persistent)
+
+
+# 진행 중인 번역 요청 (이벤트 루프, 캐시 키) → Future
+# 캐시에 결과가 저장되기 전 같은 원문이 동시에 요청되면 첫 요청의 결과를 함께 기다림
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: str, coro_factory):
+    """
+    같은 키의 요청이 진행 중이면 그 결과를 기다려 재사용하고, 없으면 coro_factory()를 실행합니다.
+    Future는 이벤트 루프에 묶이므로 루프별로 구분합니다.
+    """
+    loop = asyncio.get_running_loop()
+    flight_key = (loop, key)
+    fut = _inflight.get(flight_key)
+    if fut is not None:
+        return await asyncio.shield(fut)
+
+    fut = loop.create_future()
+    _inflight[flight_key] = fut
+    try:
+        result = await coro_factory()
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            fut.cancel()
+        else:
+            fut.set_exception(e)
+            fut.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(flight_key, None)
+
+
+# ──────────────────────────────────────────────
+#  요약·맥락 결과 메모 (같은 입력 재호출 시 API 생략)
+# ──────────────────────────────────────────────
+
+CONTEXT_MEMO_SIZE = 256
+_context_memo: OrderedDict[str, str] = OrderedDict()
+
+
+def _context_memo_key(kind: str, text: str, target_lang: str) -> str:
+    """입력 텍스트 해시 + 대상 언어 + 배포 이름으로 메모 키를 만듭니다 (긴 원문을 키로 보관하지 않음)."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{kind}:{digest}:{target_lang}:{_get_deployment()}"
+
+
+def _memo_get(key: str) -> str | None:
+    value = _context_memo.get(key)
+    if value is not None:
+        _context_memo.move_to_end(key)
+    return value
+
+
+def _memo_set(key: str, value: str) -> None:
+    _context_memo[key] = value
+    _context_memo.move_to_end(key)
+    if len(_context_memo) > CONTEXT_MEMO_SIZE:
+        _context_memo.popitem(last=False)
+
+
 # ──────────────────────────────────────────────
 #  Phase 0: 프레젠테이션 전체 맥락 파악 (상위 N장)
 # ──────────────────────────────────────────────
 
-def get_presentation_summary(slides_text: str, target_lang: str) -> str:
+async def aget_presentation_summary(slides_text: str, target_lang: str) -> str:
     """
     프레젠테이션 상위 슬라이드 텍스트를 분석하여 전체 목적·방향을 요약합니다.
     이 요약은 이후 모든 슬라이드 번역의 기본 맥락으로 사용됩니다.
+    같은 입력으로 다시 호출하면 메모된 결과를 반환합니다.
     """
+    memo_key = _context_memo_key("summary", slides_text, target_lang)
+    cached = _memo_get(memo_key)
+    if cached is not None:
+        return cached
+
     lang_name = get_lang_name(target_lang)
 
     messages = [
@@ -164,20 +646,34 @@ def get_presentation_summary(slides_text: str, target_lang: str) -> str:
     ]
 
     try:
-        return _call_chat(messages, temperature=0.2)
+        summary = await _acall_chat(messages, temperature=0.2, context_call=True)
     except Exception as e:
         logger.warning(f"프레젠테이션 전체 맥락 파악 실패: {e}")
         return ""
+    if summary:
+        _memo_set(memo_key, summary)
+    return summary
+
+
+def get_presentation_summary(slides_text: str, target_lang: str) -> str:
+    """aget_presentation_summary()의 동기 래퍼입니다."""
+    return _run_sync(aget_presentation_summary(slides_text, target_lang))
 
 
 # ──────────────────────────────────────────────
 #  Phase 1: 슬라이드 맥락 파악
 # ──────────────────────────────────────────────
 
-def get_slide_context(slide_text: str, target_lang: str) -> str:
+async def aget_slide_context(slide_text: str, target_lang: str) -> str:
     """
     슬라이드 전체 텍스트를 분석하여 맥락 요약을 반환합니다.
+    같은 입력으로 다시 호출하면 메모된 결과를 반환합니다.
     """
+    memo_key = _context_memo_key("context", slide_text, target_lang)
+    cached = _memo_get(memo_key)
+    if cached is not None:
+        return cached
+
     lang_name = get_lang_name(target_lang)
 
     messages = [
@@ -198,10 +694,18 @@ def get_slide_context(slide_text: str, target_lang: str) -> str:
     ]
 
     try:
-        return _call_chat(messages, temperature=0.2)
+        context = await _acall_chat(messages, temperature=0.2, context_call=True)
     except Exception as e:
         logger.warning(f"맥락 파악 실패, 빈 맥락으로 진행: {e}")
         return ""
+    if context:
+        _memo_set(memo_key, context)
+    return context
+
+
+def get_slide_context(slide_text: str, target_lang: str) -> str:
+    """aget_slide_context()의 동기 래퍼입니다."""
+    return _run_sync(aget_slide_context(slide_text, target_lang))
 
 
 # ──────────────────────────────────────────────
@@ -246,6 +750,27 @@ TRANSLATION_RESPONSE_SCHEMA = {
     },
 }
 
+# Run 수가 이보다 적으면 strict 스키마 대신 json_object 모드 사용 (서버 측 스키마 강제 비용 생략)
+DEFAULT_JSON_OBJECT_MAX_RUNS = 8
+
+# json_object 모드에서는 응답 형식을 프롬프트로 알려야 함 (프롬프트에 "JSON" 포함 필수)
+_JSON_OBJECT_HINT = """
+## 응답 형식
+아래 예시와 같은 구조의 JSON 객체만 출력하세요.
+{"paragraphs": [{"runs": [{"text": "번역된 텍스트", "style_id": "S0"}]}]}"""
+
+
+def _choose_response_format(total_runs: int) -> dict:
+    """
+    Run 수에 따라 translate_styled_text()의 응답 형식을 선택합니다.
+    기준값 PPTX_TRANSLATOR_JSON_OBJECT_MAX_RUNS는 .env 로드 이후 값을 쓰도록 호출 시점에 읽습니다.
+    """
+    max_runs = int(os.getenv("PPTX_TRANSLATOR_JSON_OBJECT_MAX_RUNS", str(DEFAULT_JSON_OBJECT_MAX_RUNS)))
+    if total_runs < max_runs:
+        return {"type": "json_object"}
+    return TRANSLATION_RESPONSE_SCHEMA
+
+
 # JSON Schema for structured response (슬라이드 일괄 번역용)
 BATCH_TRANSLATION_RESPONSE_SCHEMA = {
     "type": "json_schema",
@@ -295,21 +820,106 @@ BATCH_TRANSLATION_RESPONSE_SCHEMA = {
     },
 }
 
+# slide_context를 text_boxes보다 먼저 생성하도록 한 변형 — 슬라이드 요약 후 그 요약을 바탕으로 번역
+BATCH_WITH_CONTEXT_RESPONSE_SCHEMA = copy.deepcopy(BATCH_TRANSLATION_RESPONSE_SCHEMA)
+BATCH_WITH_CONTEXT_RESPONSE_SCHEMA["json_schema"]["name"] = "batch_translation_result_with_context"
+BATCH_WITH_CONTEXT_RESPONSE_SCHEMA["json_schema"]["schema"]["properties"] = {
+    "slide_context": {"type": "string"},
+    **BATCH_TRANSLATION_RESPONSE_SCHEMA["json_schema"]["schema"]["properties"],
+}
+BATCH_WITH_CONTEXT_RESPONSE_SCHEMA["json_schema"]["schema"]["required"] = ["slide_context", "text_boxes"]
 
-def translate_styled_text(styled_data: dict, context: str, target_lang: str,
-                          pres_summary: str = "") -> dict | None:
+_include_slide_context = False
+
+
+def configure_slide_context(enabled: bool = True) -> None:
     """
-    스타일 ID가 매핑된 텍스트 데이터를 번역합니다.
+    일괄 번역 응답에 슬라이드 요약(slide_context)을 함께 생성하도록 설정합니다.
+    별도 맥락 호출 없이, 모델이 같은 응답 안에서 먼저 슬라이드를 요약한 뒤 번역합니다.
+    """
+    global _include_slide_context
+    _include_slide_context = enabled
 
-    Args:
-        styled_data: extract_styled_paragraphs()가 반환한 구조
-        context: get_slide_context()가 반환한 맥락 요약
-        target_lang: 대상 언어 코드 (예: 'ko')
-        pres_summary: 프레젠테이션 전체 맥락 요약 (상위 3장 기반)
 
-    Returns:
-        {"paragraphs": [{"runs": [{"text": "...", "style_id": "S0"}, ...]}]}
-        실패 시 None 반환
+def _batch_response_format() -> dict:
+    """현재 설정에 맞는 일괄 번역 응답 스키마를 반환합니다."""
+    if _include_slide_context:
+        return BATCH_WITH_CONTEXT_RESPONSE_SCHEMA
+    return BATCH_TRANSLATION_RESPONSE_SCHEMA
+
+
+_PT_PER_EMU = 1 / 12700
+_EMPHASIS_LABELS = (("bold", "볼드"), ("italic", "이탤릭"), ("underline", "밑줄"))
+
+
+@lru_cache(maxsize=2048)
+def _describe_style(style_key: tuple) -> str:
+    """
+    스타일 속성을 프롬프트용 설명 문자열로 변환합니다.
+    style_key는 tuple(sorted(style.items())) — 여러 텍스트박스가 공유하는 스타일은 1회만 계산합니다.
+    """
+    sdict = dict(style_key)
+    desc_parts = [label for key, label in _EMPHASIS_LABELS if sdict.get(key)]
+    if "size" in sdict:
+        size = sdict["size"]
+        pt_size = size * _PT_PER_EMU if isinstance(size, int) else size
+        desc_parts.append(f"크기:{pt_size:.0f}pt")
+    if "name" in sdict:
+        desc_parts.append(f"폰트:{sdict['name']}")
+    if "color_rgb" in sdict:
+        desc_parts.append(f"색상:#{sdict['color_rgb']}")
+    return ", ".join(desc_parts) if desc_parts else "기본"
+
+
+def _render_styles(styles_desc: dict[str, str]) -> str:
+    """스타일 참조를 "S0=기본" 형식의 줄 목록으로 만듭니다 (JSON보다 토큰이 적음)."""
+    return "\n".join(f"{sid}={desc}" for sid, desc in styles_desc.items())
+
+
+# 시스템 프롬프트 템플릿 디렉터리
+_PROMPT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+
+
+def _load_prompt(name: str) -> str:
+    """prompts/ 아래의 시스템 프롬프트 템플릿을 읽습니다 (str.format_map 형식, 리터럴 중괄호는 {{ }})."""
+    with open(os.path.join(_PROMPT_DIR, name), encoding="utf-8") as f:
+        return f.read().removesuffix("\n")
+
+
+# 번역 규칙 본문 — 모듈 로드 시 1회 읽고, 호출 시 format_map 한 번으로 채움
+_STYLED_SYS_TMPL = _load_prompt("styled_system.txt")
+_BATCH_SYS_TMPL = _load_prompt("batch_system.txt")
+
+# 시스템 프롬프트의 고정 앞부분과 요청별 가변 영역의 경계 — 고정 부분이 항상 앞에 오도록 유지
+_VARIABLE_SECTION = "--- VARIABLE SECTION ---"
+
+
+@lru_cache(maxsize=64)
+def _styled_system_prefix(lang_name: str, pres_summary: str) -> str:
+    """
+    translate_styled_text() 시스템 프롬프트의 고정 앞부분(번역 규칙 + 프레젠테이션 맥락)을 반환합니다.
+    같은 실행 안에서는 바이트 단위로 동일하므로 서버 측 프롬프트 캐시(접두사 기준)에 적중합니다.
+    """
+    # 프레젠테이션 전체 맥락 섹션
+    pres_context_section = ""
+    if pres_summary:
+        pres_context_section = f"""\n## 프레젠테이션 전체 맥락
+이 프레젠테이션의 전체 방향과 목적입니다. 번역 시 이 맥락을 반영하여 일관된 톤과 용어를 사용하세요.
+{" ".join(pres_summary.split())}
+"""
+
+    return _STYLED_SYS_TMPL.format_map({
+        "lang_name": lang_name,
+        "pres_context_section": pres_context_section,
+    })
+
+
+def _build_styled_messages(styled_data: dict, target_lang: str,
+                           pres_summary: str = "",
+                           json_object: bool = False) -> list[dict] | None:
+    """
+    translate_styled_text()용 메시지를 구성합니다. 번역할 텍스트가 없으면 None.
+    json_object=True면 시스템 프롬프트 끝에 응답 JSON 예시를 덧붙입니다.
     """
     lang_name = get_lang_name(target_lang)
 
@@ -323,23 +933,10 @@ def translate_styled_text(styled_data: dict, context: str, target_lang: str,
         return None
 
     # 스타일 정보를 사람 읽기 가능하게 변환
-    styles_desc = {}
-    for sid, sdict in styled_data["styles"].items():
-        desc_parts = []
-        if sdict.get("bold"):
-            desc_parts.append("볼드")
-        if sdict.get("italic"):
-            desc_parts.append("이탤릭")
-        if sdict.get("underline"):
-            desc_parts.append("밑줄")
-        if "size" in sdict:
-            pt_size = sdict["size"] / 12700 if isinstance(sdict["size"], int) else sdict["size"]
-            desc_parts.append(f"크기:{pt_size:.0f}pt")
-        if "name" in sdict:
-            desc_parts.append(f"폰트:{sdict['name']}")
-        if "color_rgb" in sdict:
-            desc_parts.append(f"색상:#{sdict['color_rgb']}")
-        styles_desc[sid] = ", ".join(desc_parts) if desc_parts else "기본"
+    styles_desc = {
+        sid: _describe_style(tuple(sorted(sdict.items())))
+        for sid, sdict in styled_data["styles"].items()
+    }
 
     # --- 입력 텍스트 구조를 보기 좋게 정리 ---
     input_paras = []
@@ -349,95 +946,268 @@ def translate_styled_text(styled_data: dict, context: str, target_lang: str,
             input_runs.append({"text": run["text"], "style_id": run["style_id"]})
         input_paras.append({"runs": input_runs})
 
-    input_json = json.dumps(
+    # 들여쓰기 없는 compact JSON — 입력 토큰 절약
+    input_json = orjson.dumps(
         {"paragraphs": input_paras, "styles_description": styles_desc},
-        ensure_ascii=False,
-        indent=2,
+    ).decode()
+
+    system_prompt = (
+        f"{_styled_system_prefix(lang_name, pres_summary)}\n\n{_VARIABLE_SECTION}\n\n"
+        f"## 스타일 참조\n{_render_styles(styles_desc)}"
     )
+    if json_object:
+        system_prompt += f"\n{_JSON_OBJECT_HINT}"
+
+    user_msg = f"아래 텍스트를 {lang_name}로 번역하세요:\n\n{input_json}"
+
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_msg},
+    ]
+    return messages
+
+
+def _parse_styled_result(result_str: str, styled_data: dict) -> dict | None:
+    """translate_styled_text() 응답 JSON을 검증·보정하여 반환합니다."""
+    result = orjson.loads(result_str)
 
+    # 기본 구조 유효성 검사
+    if "paragraphs" not in result:
+        logger.error("번역 결과에 'paragraphs' 키가 없습니다.")
+        return None
+
+    for para in result["paragraphs"]:
+        if "runs" not in para:
+            para["runs"] = []
+        for run in para["runs"]:
+            if "text" not in run:
+                run["text"] = ""
+            if "style_id" not in run:
+                run["style_id"] = "S0"
+
+    # ── 원문 / 번역 비교 로그 ──
+    orig_text = " | ".join(
+        "".join(r["text"] for r in p["runs"])
+        for p in styled_data["paragraphs"]
+    ).strip()
+    trans_text = " | ".join(
+        "".join(r["text"] for r in p["runs"])
+        for p in result["paragraphs"]
+    ).strip()
+    logger.info(f"  [원문] {orig_text}")
+    logger.info(f"  [번역] {trans_text}")
+
+    return result
+
+
+async def atranslate_styled_text(styled_data: dict, context: str, target_lang: str,
+                                 pres_summary: str = "") -> dict | None:
+    """
+    스타일 ID가 매핑된 텍스트 데이터를 번역합니다.
+
+    Args:
+        styled_data: extract_styled_paragraphs()가 반환한 구조
+        context: get_slide_context()가 반환한 맥락 요약
+        target_lang: 대상 언어 코드 (예: 'ko')
+        pres_summary: 프레젠테이션 전체 맥락 요약 (상위 3장 기반)
+
+    Returns:
+        {"paragraphs": [{"runs": [{"text": "...", "style_id": "S0"}, ...]}]}
+        실패 시 None 반환
+    """
+    # 같은 원문(텍스트 + 스타일 구조)을 이미 번역했으면 재사용
+    cache_key = translation_cache_key(styled_data, target_lang)
+    cached = get_cached_translation(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await _single_flight(
+        cache_key, lambda: _arequest_styled_translation(styled_data, target_lang, pres_summary, cache_key)
+    )
+    # 같은 결과를 공유한 다른 요청과 분리 (호출 측 수정이 서로 영향을 주지 않도록)
+    return copy.deepcopy(result)
+
+
+async def _arequest_styled_translation(styled_data: dict, target_lang: str, pres_summary: str,
+                                       cache_key: str) -> dict | None:
+    """atranslate_styled_text()의 실제 API 호출부 — 성공 시 결과를 캐시에 저장합니다."""
+    total_runs = sum(len(p["runs"]) for p in styled_data["paragraphs"])
+    response_format = _choose_response_format(total_runs)
+    messages = _build_styled_messages(
+        styled_data, target_lang, pres_summary,
+        json_object=response_format is not TRANSLATION_RESPONSE_SCHEMA,
+    )
+    if messages is None:
+        return None
+
+    try:
+        result_str = await _acall_chat(messages, response_format=response_format)
+        result = _parse_styled_result(result_str, styled_data)
+        if result is not None:
+            cache_translation(cache_key, result)
+        return result
+
+    except orjson.JSONDecodeError as e:
+        logger.error(f"번역 결과 JSON 파싱 실패: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"번역 API 호출 실패: {e}")
+        return None
+
+
+def translate_styled_text(styled_data: dict, context: str, target_lang: str,
+                          pres_summary: str = "") -> dict | None:
+    """atranslate_styled_text()의 동기 래퍼입니다."""
+    return _run_sync(atranslate_styled_text(styled_data, context, target_lang, pres_summary))
+
+
+# ──────────────────────────────────────────────
+#  Phase 2-B: 슬라이드 일괄 번역 (텍스트박스 N개 → API 1회)
+# ──────────────────────────────────────────────
+
+def _render_recent_section(pairs: list[dict]) -> str:
+    """원문→번역 쌍을 '직전 슬라이드 번역 이력' 프롬프트 섹션으로 만듭니다."""
+    if not pairs:
+        return ""
+    lines = [f"- \"{p['src']}\" → \"{p['tgt']}\"" for p in pairs]
+    return "\n## 직전 슬라이드 번역 이력\n" \
+        "아래는 이전 슬라이드에서 번역된 원문→번역 쌍입니다. " \
+        "**동일하거나 유사한 용어가 등장하면 반드시 같은 번역을 사용하여 일관성을 유지하세요.**\n" \
+        + "\n".join(lines) + "\n"
+
+
+class RecentTranslations:
+    """
+    직전 max_slides장의 원문→번역 쌍 (용어 일관성 유지용 슬라이딩 윈도우).
+
+    렌더링한 프롬프트 섹션을 보관해 두고, 새 슬라이드가 추가될 때만 다시 만듭니다.
+    슬라이드가 동시에 번역되는 동안 여러 그룹이 같은 섹션 문자열을 재사용합니다.
+    """
+
+    def __init__(self, max_slides: int = 3, max_pairs: int = 30,
+                 initial: list[list[dict]] | None = None):
+        self.max_pairs = max_pairs
+        self._slides: deque[list[dict]] = deque(
+            (pairs for pairs in initial or () if pairs), maxlen=max_slides,
+        )
+        self._rendered: str | None = None
+
+    def add_slide(self, pairs: list[dict]) -> None:
+        """슬라이드 하나의 번역 쌍을 추가합니다 (가장 오래된 슬라이드는 밀려남)."""
+        if not pairs:
+            return
+        self._slides.append(pairs)
+        self._rendered = None
+
+    def render(self) -> str:
+        """프롬프트 섹션을 반환합니다. 이력이 없으면 빈 문자열 (토큰 절약: 최대 max_pairs쌍)."""
+        if self._rendered is None:
+            pairs = [pair for slide_pairs in self._slides for pair in slide_pairs]
+            self._rendered = _render_recent_section(pairs[-self.max_pairs:])
+        return self._rendered
+
+
+@lru_cache(maxsize=64)
+def _batch_system_prefix(lang_name: str, pres_summary: str, include_context: bool) -> str:
+    """
+    translate_slide_batch() 시스템 프롬프트의 고정 앞부분(번역 규칙 + 프레젠테이션 맥락)을 반환합니다.
+    슬라이드마다 달라지는 번역 이력·스타일 참조는 뒤쪽 가변 영역에 붙입니다.
+    """
     # 프레젠테이션 전체 맥락 섹션
     pres_context_section = ""
     if pres_summary:
         pres_context_section = f"""\n## 프레젠테이션 전체 맥락
 이 프레젠테이션의 전체 방향과 목적입니다. 번역 시 이 맥락을 반영하여 일관된 톤과 용어를 사용하세요.
-{pres_summary}
+{" ".join(pres_summary.split())}
 """
 
-    system_prompt = f"""당신은 프레젠테이션 번역 전문가입니다. 아래 규칙을 엄격히 따르세요.
-{pres_context_section}
-## 번역 규칙
-1. 주어진 텍스트를 **{lang_name}**로 자연스럽고 읽기 쉽게 번역합니다. **자연스러운 {lang_name} 어순이 최우선**입니다.
-2. **영문 유지 대상 (이것만 영문으로 유지):**
-   - 제품/서비스 고유명사: Azure, Cosmos DB, Microsoft, AWS, Google, GitHub 등
-   - 표준 약어: AI, ML, IoT, SaaS, API, SDK, GPT, RAG 등
-   - 프로그래밍 용어: Python, JavaScript, JSON, REST 등
-3. **반드시 번역하는 일반 영단어:**
-   - model→모델, data→데이터, foundation→기반/기초, commitment→약속/보장, copyright→저작권
-   - protected→보호, customer→고객, enterprise→엔터프라이즈, security→보안
-   - 일반적으로 한국어 IT 문서에서 번역하여 사용하는 단어는 모두 번역하세요.
-4. 번역 결과가 원문과 동일하더라도(예: 이미 대상 언어이거나 고유명사만인 경우) 반드시 결과를 반환하세요. 빈 텍스트로 반환하지 마세요.
-
-## 프레젠테이션 어미 규칙
-5. 프레젠테이션용 번역이므로, 구어체("-합니다", "-입니다")가 아닌 **간결한 명사형/체언형 어미**를 사용하세요.
-   - 예: "데이터를 분석합니다" → "데이터 분석", "성능을 향상시킵니다" → "성능 향상"
-   - 제목/키워드: 명사형 종결 (예: "실시간 데이터 처리", "글로벌 확장 지원")
-   - 설명문: 간결한 문장형 (예: "~를 통해 ~를 실현", "~로 ~를 지원")
-   - 단, 문맥상 완전한 문장이 자연스러운 경우(긴 설명, 인용 등)에는 "-합니다" 체를 허용합니다.
-
-## 스타일 보존 및 어순 규칙 (가장 중요 — 우선순위 순서대로 적용)
-
-### 우선순위 1: 자연스러운 한국어 어순
-- 모든 Run을 연결하면 **자연스러운 한국어 문장**이 되어야 합니다.
-- 영어는 SVO(주어-동사-목적어), 한국어는 SOV(주어-목적어-동사)입니다.
-- 따라서 **Run의 순서와 내용을 한국어 어순에 맞게 재배치**해야 합니다.
-
-### 우선순위 2: 강조 스타일의 의미 보존
-6. 각 Run에는 `style_id`가 있으며, 이는 시각적 서식(볼드, 색상 등)을 나타냅니다.
-7. 강조 스타일(S0이 아닌 style_id)이 적용된 텍스트는 번역에서도 동일한 의미 범위를 유지하세요.
-
-### 우선순위 3: Run 수 유지
-8. 원문과 동일한 수의 Run을 유지하세요. 필요시 빈 Run("")을 남기고 다른 Run으로 텍스트를 옮기세요.
-
-### ★ 예시 (반드시 따라야 함):
-**원문 (4 runs, 영어 SVO 어순):**
-[{{"text": "Your data ", "style_id": "S0"}}, {{"text": "is not used", "style_id": "S1"}}, {{"text": " ", "style_id": "S2"}}, {{"text": "to train or enrich foundation ", "style_id": "S0"}}]
-
-**올바른 번역 (4 runs, 한국어 SOV 어순으로 재배치):**
-[{{"text": "기반 AI 모델 학습·강화에 ", "style_id": "S0"}}, {{"text": "사용되지 않음", "style_id": "S1"}}, {{"text": " ", "style_id": "S2"}}, {{"text": "", "style_id": "S0"}}]
-→ "기반 AI 모델 학습·강화에 **사용되지 않음**" — 자연스러운 한국어!
-→ S0 내용을 앞으로 이동하고, S1(강조)을 문장 뒤에 배치. 남는 Run은 빈 문자열로 채움.
-
-**잘못된 번역 (Run 순서 그대로 → 어순 어색):**
-[{{"text": "데이터는 ", "style_id": "S0"}}, {{"text": "사용되지 않음", "style_id": "S1"}}, {{"text": " ", "style_id": "S2"}}, {{"text": "기반 AI 모델 학습", "style_id": "S0"}}]
-→ "데이터는 **사용되지 않음** 기반 AI 모델 학습" — 어순 어색!
-
-9. 공백만 있는 Run(" ")은 원래 style_id와 텍스트를 그대로 유지하세요.
-10. 존재하는 `style_id` 값만 사용하세요 (새 ID를 만들지 마세요).
-
-## 구조 규칙
-11. 원문의 paragraph 수를 유지하세요 (빈 paragraph 포함).
-12. 빈 텍스트("")만 있는 Run은 그대로 유지하세요.
-
-## 스타일 참조
-{json.dumps(styles_desc, ensure_ascii=False, indent=2)}"""
+    # ── 슬라이드 요약 동시 생성 (configure_slide_context) ──
+    context_section = ""
+    if include_context:
+        context_section = "\n## 슬라이드 요약\n" \
+            "먼저 모든 텍스트 박스를 읽고 이 슬라이드의 주제와 핵심 맥락을 " \
+            "`slide_context`에 2~3문장으로 요약한 뒤, 그 요약을 바탕으로 번역하세요. " \
+            "고유명사, 솔루션 이름, 기술 용어는 원문 그대로 언급하세요.\n"
 
-    user_msg = f"아래 텍스트를 {lang_name}로 번역하세요:\n\n{input_json}"
+    return _BATCH_SYS_TMPL.format_map({
+        "lang_name": lang_name,
+        "pres_context_section": pres_context_section,
+        "context_section": context_section,
+    })
+
+
+def _build_batch_messages(
+    text_boxes: list[dict],
+    target_lang: str,
+    pres_summary: str = "",
+    recent_translations: RecentTranslations | list[dict] | None = None,
+) -> list[dict]:
+    """translate_slide_batch()용 메시지를 구성합니다."""
+    lang_name = get_lang_name(target_lang)
+
+    # ── 전체 스타일 통합 ──
+    all_styles_desc: dict[str, str] = {}
+    for tb in text_boxes:
+        for sid, sdict in tb["styled_data"]["styles"].items():
+            if sid not in all_styles_desc:
+                all_styles_desc[sid] = _describe_style(tuple(sorted(sdict.items())))
+
+    # ── 입력 JSON 구성 ──
+    input_boxes = []
+    for tb in text_boxes:
+        sd = tb["styled_data"]
+        paras = []
+        for para in sd["paragraphs"]:
+            runs = [{"text": r["text"], "style_id": r["style_id"]} for r in para["runs"]]
+            paras.append({"runs": runs})
+        input_boxes.append({"box_id": tb["box_id"], "paragraphs": paras})
+
+    # 들여쓰기 없는 compact JSON — 입력 토큰 절약
+    input_json = orjson.dumps(
+        {"text_boxes": input_boxes, "styles_description": all_styles_desc},
+    ).decode()
+
+    # ── 직전 슬라이드 번역 이력 (용어 일관성) ──
+    if isinstance(recent_translations, RecentTranslations):
+        recent_section = recent_translations.render()
+    else:
+        # 토큰 절약: 최대 30쌍만 전달
+        recent_section = _render_recent_section((recent_translations or [])[-30:])
+
+    system_prompt = (
+        f"{_batch_system_prefix(lang_name, pres_summary, _include_slide_context)}\n\n"
+        f"{_VARIABLE_SECTION}\n{recent_section}\n"
+        f"## 스타일 참조\n{_render_styles(all_styles_desc)}"
+    )
+
+    user_msg = f"아래 슬라이드의 텍스트 박스들을 {lang_name}로 번역하세요:\\n\\n{input_json}"
 
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_msg},
     ]
+    return messages
 
-    try:
-        result_str = _call_chat(messages, response_format=TRANSLATION_RESPONSE_SCHEMA)
-        result = json.loads(result_str)
 
-        # 기본 구조 유효성 검사
-        if "paragraphs" not in result:
-            logger.error("번역 결과에 'paragraphs' 키가 없습니다.")
-            return None
+def _parse_batch_result(result_str: str, text_boxes: list[dict]) -> dict | None:
+    """translate_slide_batch() 응답 JSON을 box_id → 번역 결과 매핑으로 변환합니다."""
+    result = orjson.loads(result_str)
+
+    if "text_boxes" not in result:
+        logger.error("일괄 번역 결과에 'text_boxes' 키가 없습니다.")
+        return None
 
-        for para in result["paragraphs"]:
+    if result.get("slide_context"):
+        logger.info(f"  슬라이드 요약: {result['slide_context']}")
+
+    # box_id → 번역 결과 매핑
+    translated_map: dict[str, dict] = {}
+    for tb in result["text_boxes"]:
+        box_id = tb.get("box_id", "")
+        para_data = {"paragraphs": tb.get("paragraphs", [])}
+
+        # 구조 보정
+        for para in para_data["paragraphs"]:
             if "runs" not in para:
                 para["runs"] = []
             for run in para["runs"]:
@@ -446,41 +1216,104 @@ def translate_styled_text(styled_data: dict, context: str, target_lang: str,
                 if "style_id" not in run:
                     run["style_id"] = "S0"
 
-        # ── 원문 / 번역 비교 로그 ──
+        translated_map[box_id] = para_data
+
+    # ── 로그 ──
+    for tb in text_boxes:
+        box_id = tb["box_id"]
         orig_text = " | ".join(
             "".join(r["text"] for r in p["runs"])
-            for p in styled_data["paragraphs"]
-        ).strip()
-        trans_text = " | ".join(
-            "".join(r["text"] for r in p["runs"])
-            for p in result["paragraphs"]
+            for p in tb["styled_data"]["paragraphs"]
         ).strip()
-        logger.info(f"  [원문] {orig_text}")
-        logger.info(f"  [번역] {trans_text}")
+        if box_id in translated_map:
+            trans_text = " | ".join(
+                "".join(r["text"] for r in p["runs"])
+                for p in translated_map[box_id]["paragraphs"]
+            ).strip()
+            logger.info(f"  [{box_id}] \"{orig_text}\" → \"{trans_text}\"")
+        else:
+            logger.warning(f"  [{box_id}] 번역 결과 누락 — 원문 유지")
 
-        return result
+    return translated_map
 
-    except json.JSONDecodeError as e:
-        logger.error(f"번역 결과 JSON 파싱 실패: {e}")
+
+MAX_BATCH_INPUT_TOKENS = 12000  # 일괄 번역 1회 요청의 텍스트박스 입력 토큰 상한 (추정치, 프롬프트 고정부 제외)
+
+
+def _estimate_box_tokens(text_box: dict) -> int:
+    """텍스트박스 하나의 입력 토큰 수를 대략 추정합니다 (Run당 JSON 구조 약 30자 포함, 문자 3개 ≈ 1토큰)."""
+    return sum(
+        len(run["text"]) + 30
+        for para in text_box["styled_data"]["paragraphs"]
+        for run in para["runs"]
+    ) // 3
+
+
+def _split_text_boxes(text_boxes: list[dict], budget: int) -> list[list[dict]]:
+    """텍스트박스를 순서대로 채워 넣어, 추정 토큰이 budget 이하인 묶음들로 나눕니다."""
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    used = 0
+    for tb in text_boxes:
+        cost = _estimate_box_tokens(tb)
+        if current and used + cost > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(tb)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def _atranslate_chunk(
+    text_boxes: list[dict],
+    target_lang: str,
+    pres_summary: str,
+    recent_translations: RecentTranslations | list[dict] | None,
+) -> dict | None:
+    """
+    텍스트박스 묶음 하나를 1회 API 호출로 번역합니다.
+    모델 입력 한도 초과(context_length_exceeded) 시 묶음을 반으로 나눠 재귀적으로 재시도합니다.
+    """
+    messages = _build_batch_messages(text_boxes, target_lang, pres_summary,
+                                     recent_translations)
+
+    try:
+        result_str = await _acall_chat(messages, response_format=_batch_response_format())
+        return _parse_batch_result(result_str, text_boxes)
+
+    except BadRequestError as e:
+        if getattr(e, "code", None) != "context_length_exceeded" or len(text_boxes) < 2:
+            logger.error(f"일괄 번역 API 호출 실패: {e}")
+            return None
+        mid = len(text_boxes) // 2
+        logger.warning(f"입력 한도 초과 — 텍스트박스 {len(text_boxes)}개를 둘로 나눠 재시도")
+        halves = await asyncio.gather(
+            _atranslate_chunk(text_boxes[:mid], target_lang, pres_summary, recent_translations),
+            _atranslate_chunk(text_boxes[mid:], target_lang, pres_summary, recent_translations),
+        )
+        if None in halves:
+            return None
+        return {**halves[0], **halves[1]}
+    except orjson.JSONDecodeError as e:
+        logger.error(f"일괄 번역 결과 JSON 파싱 실패: {e}")
         return None
     except Exception as e:
-        logger.error(f"번역 API 호출 실패: {e}")
+        logger.error(f"일괄 번역 API 호출 실패: {e}")
         return None
 
 
-# ──────────────────────────────────────────────
-#  Phase 2-B: 슬라이드 일괄 번역 (텍스트박스 N개 → API 1회)
-# ──────────────────────────────────────────────
-
-def translate_slide_batch(
+async def atranslate_slide_batch(
     text_boxes: list[dict],
     context: str,
     target_lang: str,
     pres_summary: str = "",
-    recent_translations: list[dict] | None = None,
+    recent_translations: RecentTranslations | list[dict] | None = None,
 ) -> dict | None:
     """
     슬라이드 내 여러 텍스트박스를 한 번의 API 호출로 일괄 번역합니다.
+    입력이 MAX_BATCH_INPUT_TOKENS(추정치)를 넘으면 여러 요청으로 나눠 동시에 번역한 뒤 합칩니다.
 
     Args:
         text_boxes: [{"box_id": "T0", "styled_data": {...}}, ...]
@@ -493,196 +1326,207 @@ def translate_slide_batch(
         {"T0": {"paragraphs": [...]}, "T1": {"paragraphs": [...]}, ...}
         실패 시 None
     """
-    lang_name = get_lang_name(target_lang)
     if not text_boxes:
         return {}
 
-    # ── 전체 스타일 통합 ──
-    all_styles_desc: dict[str, str] = {}
-    for tb in text_boxes:
-        sd = tb["styled_data"]
-        for sid, sdict in sd["styles"].items():
-            if sid in all_styles_desc:
-                continue
-            desc_parts = []
-            if sdict.get("bold"):
-                desc_parts.append("볼드")
-            if sdict.get("italic"):
-                desc_parts.append("이탤릭")
-            if sdict.get("underline"):
-                desc_parts.append("밑줄")
-            if "size" in sdict:
-                pt_size = sdict["size"] / 12700 if isinstance(sdict["size"], int) else sdict["size"]
-                desc_parts.append(f"크기:{pt_size:.0f}pt")
-            if "name" in sdict:
-                desc_parts.append(f"폰트:{sdict['name']}")
-            if "color_rgb" in sdict:
-                desc_parts.append(f"색상:#{sdict['color_rgb']}")
-            all_styles_desc[sid] = ", ".join(desc_parts) if desc_parts else "기본"
+    chunks = _split_text_boxes(text_boxes, MAX_BATCH_INPUT_TOKENS)
+    if len(chunks) == 1:
+        return await _atranslate_chunk(text_boxes, target_lang, pres_summary, recent_translations)
+
+    logger.info(f"  입력이 커서 텍스트박스 {len(text_boxes)}개를 {len(chunks)}개 요청으로 나눠 번역")
+    results = await asyncio.gather(*[
+        _atranslate_chunk(chunk, target_lang, pres_summary, recent_translations)
+        for chunk in chunks
+    ])
+    # 한 묶음이라도 실패하면 기존과 같이 None — 호출 측 개별 번역 폴백으로 처리
+    if any(result is None for result in results):
+        return None
+    translated_map: dict[str, dict] = {}
+    for result in results:
+        translated_map.update(result)
+    return translated_map
 
-    # ── 입력 JSON 구성 ──
-    input_boxes = []
-    for tb in text_boxes:
-        sd = tb["styled_data"]
-        paras = []
-        for para in sd["paragraphs"]:
-            runs = [{"text": r["text"], "style_id": r["style_id"]} for r in para["runs"]]
-            paras.append({"runs": runs})
-        input_boxes.append({"box_id": tb["box_id"], "paragraphs": paras})
 
-    input_json = json.dumps(
-        {"text_boxes": input_boxes, "styles_description": all_styles_desc},
-        ensure_ascii=False,
-        indent=2,
+def translate_slide_batch(
+    text_boxes: list[dict],
+    context: str,
+    target_lang: str,
+    pres_summary: str = "",
+    recent_translations: RecentTranslations | list[dict] | None = None,
+) -> dict | None:
+    """atranslate_slide_batch()의 동기 래퍼입니다."""
+    return _run_sync(atranslate_slide_batch(
+        text_boxes, context, target_lang, pres_summary, recent_translations,
+    ))
+
+
+# ──────────────────────────────────────────────
+#  Batch API: 덱 전체를 JSONL로 제출 (비용 약 50% 절감, 최대 24시간)
+# ──────────────────────────────────────────────
+
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def build_batch_request(
+    custom_id: str,
+    text_boxes: list[dict],
+    target_lang: str,
+    pres_summary: str = "",
+    recent_translations: RecentTranslations | list[dict] | None = None,
+) -> dict:
+    """
+    translate_slide_batch()와 동일한 요청을 Batch API 입력 JSONL 한 줄로 만듭니다.
+
+    Returns:
+        {"custom_id": ..., "method": "POST", "url": "/chat/completions", "body": {...}}
+    """
+    messages = _build_batch_messages(text_boxes, target_lang, pres_summary,
+                                     recent_translations)
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/chat/completions",
+        "body": {
+            "model": _get_batch_deployment(),
+            "messages": messages,
+            "temperature": 0.3,
+            "reasoning_effort": "none",
+            "response_format": _batch_response_format(),
+        },
+    }
+
+
+def submit_batch_file(requests: list[dict]) -> str:
+    """
+    요청 목록을 JSONL 파일로 업로드하고 배치 작업을 생성합니다.
+
+    Returns:
+        배치 ID
+    """
+    client = _get_client()
+    data = b"\n".join(orjson.dumps(r) for r in requests)
+    batch_file = client.files.create(
+        file=("pptx-translator-batch.jsonl", data),
+        purpose="batch",
     )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Batch 작업 생성: {batch.id} (요청 {len(requests)}건)")
+    return batch.id
 
-    # ── 프롬프트 구성 ──
-    pres_context_section = ""
-    if pres_summary:
-        pres_context_section = f"""\n## 프레젠테이션 전체 맥락
-이 프레젠테이션의 전체 방향과 목적입니다. 번역 시 이 맥락을 반영하여 일관된 톤과 용어를 사용하세요.
-{pres_summary}
-"""
 
-    # ── 직전 슬라이드 번역 이력 (용어 일관성) ──
-    recent_section = ""
-    if recent_translations:
-        # 토큰 절약: 최대 30쌍만 전달
-        pairs = recent_translations[-30:]
-        lines = [f"- \"{p['src']}\" → \"{p['tgt']}\"" for p in pairs]
-        recent_section = "\n## 직전 슬라이드 번역 이력\n" \
-            "아래는 이전 슬라이드에서 번역된 원문→번역 쌍입니다. " \
-            "**동일하거나 유사한 용어가 등장하면 반드시 같은 번역을 사용하여 일관성을 유지하세요.**\n" \
-            + "\n".join(lines) + "\n"
-
-    system_prompt = f"""당신은 프레젠테이션 번역 전문가입니다. 아래 규칙을 엄격히 따르세요.
-{pres_context_section}{recent_section}
-## 입력 구조
-- 하나의 슬라이드에 포함된 여러 텍스트 박스가 `text_boxes` 배열로 제공됩니다.
-- 각 텍스트 박스는 `box_id`로 식별되며, `paragraphs` 배열을 포함합니다.
-- 텍스트 박스 간 맥락을 참고하면 더 자연스러운 번역이 가능합니다.
-
-## 번역 규칙
-1. 모든 텍스트 박스를 **{lang_name}**로 자연스럽고 읽기 쉽게 번역합니다. **자연스러운 {lang_name} 어순이 최우선**입니다.
-2. **영문 유지 대상 (이것만 영문으로 유지):**
-   - 제품/서비스 고유명사: Azure, Cosmos DB, Microsoft, AWS, Google, GitHub 등
-   - 표준 약어: AI, ML, IoT, SaaS, API, SDK, GPT, RAG 등
-   - 프로그래밍 용어: Python, JavaScript, JSON, REST 등
-3. **반드시 번역하는 일반 영단어:**
-   - model→모델, data→데이터, foundation→기반/기초, commitment→약속/보장, copyright→저작권
-   - protected→보호, customer→고객, enterprise→엔터프라이즈, security→보안
-   - 일반적으로 한국어 IT 문서에서 번역하여 사용하는 단어는 모두 번역하세요.
-4. 번역 결과가 원문과 동일하더라도(예: 이미 대상 언어이거나 고유명사만인 경우) 반드시 결과를 반환하세요. 빈 텍스트로 반환하지 마세요.
-
-## 프레젠테이션 어미 규칙
-5. 프레젠테이션용 번역이므로, 구어체("-합니다", "-입니다")가 아닌 **간결한 명사형/체언형 어미**를 사용하세요.
-   - 예: "데이터를 분석합니다" → "데이터 분석", "성능을 향상시킵니다" → "성능 향상"
-   - 제목/키워드: 명사형 종결 (예: "실시간 데이터 처리", "글로벌 확장 지원")
-   - 설명문: 간결한 문장형 (예: "~를 통해 ~를 실현", "~로 ~를 지원")
-   - 단, 문맥상 완전한 문장이 자연스러운 경우(긴 설명, 인용 등)에는 "-합니다" 체를 허용합니다.
-
-## 스타일 보존 및 어순 규칙 (가장 중요 — 우선순위 순서대로 적용)
-
-### 우선순위 1: 자연스러운 한국어 어순
-- 모든 Run을 연결하면 **자연스러운 한국어 문장**이 되어야 합니다.
-- 영어는 SVO(주어-동사-목적어), 한국어는 SOV(주어-목적어-동사)입니다.
-- 따라서 **Run의 순서와 내용을 한국어 어순에 맞게 재배치**해야 합니다.
-
-### 우선순위 2: 강조 스타일의 의미 보존
-6. 각 Run에는 `style_id`가 있으며, 이는 시각적 서식(볼드, 색상 등)을 나타냅니다.
-7. 강조 스타일(S0이 아닌 style_id)이 적용된 텍스트는 번역에서도 동일한 의미 범위를 유지하세요.
-
-### 우선순위 3: Run 수 유지
-8. 원문과 동일한 수의 Run을 유지하세요. 필요시 빈 Run("")을 남기고 다른 Run으로 텍스트를 옮기세요.
-
-### ★ 예시 (반드시 따라야 함):
-**원문 (4 runs, 영어 SVO 어순):**
-[{{"text": "Your data ", "style_id": "S0"}}, {{"text": "is not used", "style_id": "S1"}}, {{"text": " ", "style_id": "S2"}}, {{"text": "to train or enrich foundation ", "style_id": "S0"}}]
-
-**올바른 번역 (4 runs, 한국어 SOV 어순으로 재배치):**
-[{{"text": "기반 AI 모델 학습·강화에 ", "style_id": "S0"}}, {{"text": "사용되지 않음", "style_id": "S1"}}, {{"text": " ", "style_id": "S2"}}, {{"text": "", "style_id": "S0"}}]
-→ "기반 AI 모델 학습·강화에 **사용되지 않음**" — 자연스러운 한국어!
-→ S0 내용을 앞으로 이동하고, S1(강조)을 문장 뒤에 배치. 남는 Run은 빈 문자열로 채움.
-
-**잘못된 번역 (Run 순서 그대로 → 어순 어색):**
-[{{"text": "데이터는 ", "style_id": "S0"}}, {{"text": "사용되지 않음", "style_id": "S1"}}, {{"text": " ", "style_id": "S2"}}, {{"text": "기반 AI 모델 학습", "style_id": "S0"}}]
-→ "데이터는 **사용되지 않음** 기반 AI 모델 학습" — 어순 어색!
-
-9. 공백만 있는 Run(" ")은 원래 style_id와 텍스트를 그대로 유지하세요.
-10. 존재하는 `style_id` 값만 사용하세요 (새 ID를 만들지 마세요).
-
-## 구조 규칙
-11. 각 텍스트 박스의 `box_id`를 결과에서 그대로 반환하세요. 순서도 유지하세요.
-12. 각 텍스트 박스 내 paragraph 수를 유지하세요 (빈 paragraph 포함).
-13. 빈 텍스트("")만 있는 Run은 그대로 유지하세요.
-
-## 스타일 참조
-{json.dumps(all_styles_desc, ensure_ascii=False, indent=2)}"""
+MAX_BATCH_POLL_INTERVAL = 600.0  # 상태 확인 간격 상한 (초)
 
-    user_msg = f"아래 슬라이드의 텍스트 박스들을 {lang_name}로 번역하세요:\\n\\n{input_json}"
 
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_msg},
-    ]
+def wait_for_batch(batch_id: str, poll_interval: float = 30.0):
+    """
+    배치 작업이 끝날 때까지 상태를 확인하고, 최종 Batch 객체를 반환합니다.
+    확인 간격은 poll_interval초에서 시작해 매번 2배씩 늘어납니다 (최대 MAX_BATCH_POLL_INTERVAL초).
+    """
+    client = _get_client()
+    interval = poll_interval
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in BATCH_TERMINAL_STATUSES:
+            logger.info(f"Batch 작업 종료: {batch_id} ({batch.status})")
+            return batch
+
+        counts = batch.request_counts
+        if counts is not None:
+            logger.info(
+                f"Batch 작업 대기 중: {batch.status} "
+                f"({counts.completed + counts.failed}/{counts.total})"
+            )
+        else:
+            logger.info(f"Batch 작업 대기 중: {batch.status}")
+        time.sleep(interval)
+        interval = min(MAX_BATCH_POLL_INTERVAL, interval * 2)
 
-    try:
-        result_str = _call_chat(messages, response_format=BATCH_TRANSLATION_RESPONSE_SCHEMA)
-        result = json.loads(result_str)
 
-        if "text_boxes" not in result:
-            logger.error("일괄 번역 결과에 'text_boxes' 키가 없습니다.")
-            return None
+def fetch_batch_results(batch, text_boxes_by_id: dict[str, list[dict]]) -> dict[str, dict]:
+    """
+    완료된 배치의 출력 파일을 내려받아 custom_id별 번역 결과로 변환합니다.
 
-        # box_id → 번역 결과 매핑
-        translated_map: dict[str, dict] = {}
-        for tb in result["text_boxes"]:
-            box_id = tb.get("box_id", "")
-            para_data = {"paragraphs": tb.get("paragraphs", [])}
-
-            # 구조 보정
-            for para in para_data["paragraphs"]:
-                if "runs" not in para:
-                    para["runs"] = []
-                for run in para["runs"]:
-                    if "text" not in run:
-                        run["text"] = ""
-                    if "style_id" not in run:
-                        run["style_id"] = "S0"
-
-            translated_map[box_id] = para_data
-
-        # ── 로그 ──
-        for tb in text_boxes:
-            box_id = tb["box_id"]
-            orig_text = " | ".join(
-                "".join(r["text"] for r in p["runs"])
-                for p in tb["styled_data"]["paragraphs"]
-            ).strip()
-            if box_id in translated_map:
-                trans_text = " | ".join(
-                    "".join(r["text"] for r in p["runs"])
-                    for p in translated_map[box_id]["paragraphs"]
-                ).strip()
-                logger.info(f"  [{box_id}] \"{orig_text}\" → \"{trans_text}\"")
-            else:
-                logger.warning(f"  [{box_id}] 번역 결과 누락 — 원문 유지")
+    Args:
+        batch: wait_for_batch()가 반환한 Batch 객체
+        text_boxes_by_id: custom_id → 해당 요청의 text_boxes (로그/검증용)
 
-        return translated_map
+    Returns:
+        {custom_id: {box_id: {"paragraphs": [...]}, ...}, ...}
+        실패한 요청은 결과에서 빠집니다.
+    """
+    if batch.status != "completed" or not batch.output_file_id:
+        logger.error(f"Batch 작업 결과 없음: {batch.id} ({batch.status})")
+        return {}
 
-    except json.JSONDecodeError as e:
-        logger.error(f"일괄 번역 결과 JSON 파싱 실패: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"일괄 번역 API 호출 실패: {e}")
-        return None
+    client = _get_client()
+    content = client.files.content(batch.output_file_id).text
+
+    results: dict[str, dict] = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        item = orjson.loads(line)
+        custom_id = item.get("custom_id", "")
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            logger.warning(f"  [{custom_id}] Batch 요청 실패: {item.get('error') or response}")
+            continue
+        if custom_id not in text_boxes_by_id:
+            continue
+
+        try:
+            result_str = response["body"]["choices"][0]["message"]["content"]
+            translated_map = _parse_batch_result(result_str, text_boxes_by_id[custom_id])
+        except (KeyError, IndexError, TypeError, orjson.JSONDecodeError) as e:
+            logger.warning(f"  [{custom_id}] Batch 응답 해석 실패: {e}")
+            continue
+        if translated_map is not None:
+            results[custom_id] = translated_map
+
+    return results
+
+
+def translate_deck_batch(
+    text_boxes_by_id: dict[str, list[dict]],
+    target_lang: str,
+    pres_summary: str = "",
+    poll_interval: float = 30.0,
+) -> dict[str, dict]:
+    """
+    요청별 text_boxes를 하나의 Batch 작업으로 제출하고, 완료되면 결과를 모아 반환합니다.
+    build_batch_request() → submit_batch_file() → wait_for_batch() → fetch_batch_results()
+
+    Args:
+        text_boxes_by_id: custom_id → translate_slide_batch()와 같은 형식의 text_boxes
+        target_lang: 대상 언어 코드
+        pres_summary: 프레젠테이션 전체 맥락 요약
+        poll_interval: 첫 상태 확인 간격 (초, 이후 지수적으로 증가)
+
+    Returns:
+        {custom_id: {box_id: {"paragraphs": [...]}, ...}, ...}
+        실패한 요청은 결과에서 빠집니다.
+    """
+    if not text_boxes_by_id:
+        return {}
+
+    requests = [
+        build_batch_request(custom_id, text_boxes, target_lang, pres_summary=pres_summary)
+        for custom_id, text_boxes in text_boxes_by_id.items()
+    ]
+    batch_id = submit_batch_file(requests)
+    batch = wait_for_batch(batch_id, poll_interval=poll_interval)
+    return fetch_batch_results(batch, text_boxes_by_id)
 
 
 # ──────────────────────────────────────────────
 #  편의: 단순 텍스트 번역 (표 셀 등)
 # ──────────────────────────────────────────────
 
-def translate_simple_text(text: str, context: str, target_lang: str) -> str | None:
+async def atranslate_simple_text(text: str, context: str, target_lang: str) -> str | None:
     """
     단순 텍스트를 번역합니다 (스타일 매핑 불필요한 경우).
     실패 시 None을 반환합니다.
@@ -690,6 +1534,20 @@ def translate_simple_text(text: str, context: str, target_lang: str) -> str | No
     if not text.strip():
         return text
 
+    # 표 셀·바닥글 등 반복되는 원문은 API 호출 없이 재사용
+    cache_key = simple_text_cache_key(text, target_lang)
+    cached = _translation_cache.get(cache_key)
+    if cached is not None:
+        return cached["text"]
+
+    return await _single_flight(
+        cache_key, lambda: _arequest_simple_translation(text, context, target_lang, cache_key)
+    )
+
+
+async def _arequest_simple_translation(text: str, context: str, target_lang: str,
+                                       cache_key: str) -> str | None:
+    """atranslate_simple_text()의 실제 API 호출부 — 성공 시 결과를 캐시에 저장합니다."""
     lang_name = get_lang_name(target_lang)
     messages = [
         {
@@ -708,7 +1566,15 @@ def translate_simple_text(text: str, context: str, target_lang: str) -> str | No
     ]
 
     try:
-        return _call_chat(messages, temperature=0.2)
+        translated = await _acall_chat(messages, temperature=0.2)
     except Exception as e:
         logger.warning(f"단순 번역 실패: {e}")
         return None
+    if translated:
+        _translation_cache.set(cache_key, {"text": translated})
+    return translated
+
+
+def translate_simple_text(text: str, context: str, target_lang: str) -> str | None:
+    """atranslate_simple_text()의 동기 래퍼입니다."""
+    return _run_sync(atranslate_simple_text(text, context, target_lang))